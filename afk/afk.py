@@ -1,11 +1,18 @@
+import asyncio
 import discord
 import noobutils as nu
 import logging
+import time
 
 from redbot.core.bot import app_commands, commands, Config, Red
 from redbot.core.utils import chat_formatting as cf
 
-from typing import Literal
+from collections import deque, OrderedDict
+from discord.ext import tasks
+from typing import Deque, Dict, Iterable, List, Literal, Optional, Set, Tuple, Union
+
+# (pinger_id, channel_id, message_id, timestamp, message)
+PingLog = Tuple[int, int, int, int, str]
 
 
 class Afk(commands.Cog):
@@ -31,13 +38,25 @@ class Afk(commands.Cog):
             "timestamp": None,
             "pinglogs": [],
         }
-        default_global = {"delete_after": 10}
+        default_global = {"delete_after": 10, "ping_log_size": 100, "notify_cooldown": 30}
         self.config.register_guild(**default_guild)
         self.config.register_member(**default_member)
         self.config.register_global(**default_global)
         self.log = logging.getLogger("red.NoobCogs.Afk")
-
-    __version__ = "1.5.1"
+        self.afk_members: Dict[int, Set[int]] = {}
+        self.sticky_members: Dict[int, Set[int]] = {}
+        self.ping_log_size = 100
+        self.ping_buffer: Dict[Tuple[int, int], Deque[PingLog]] = {}
+        self.ping_lock = asyncio.Lock()
+        self.user_cache: "OrderedDict[int, Optional[discord.User]]" = OrderedDict()
+        self.notify_cooldown = 30
+        # {afk_user_id: {channel_id: time.monotonic() of the last notice}}
+        self.notified: Dict[int, Dict[int, float]] = {}
+
+    max_ping_content = 200
+    user_cache_size = 1000
+
+    __version__ = "1.6.0"
     __author__ = ["NoobInDaHause"]
     __docs__ = "https://github.com/NoobInDaHause/NoobCogs/blob/red-3.5/afk/README.md"
 
@@ -52,6 +71,132 @@ class Afk(commands.Cog):
         Cog Author{plural}: {cf.humanize_list([f'**{auth}**' for auth in self.__author__])}
         Cog Documentation: [[Click here]]({self.__docs__})"""
 
+    async def cog_load(self):
+        self.afk_members.clear()
+        self.sticky_members.clear()
+        for guild_id, members in (await self.config.all_members()).items():
+            for member_id, member_data in members.items():
+                if member_data["afk"]:
+                    self.afk_members.setdefault(guild_id, set()).add(member_id)
+                if member_data["sticky"]:
+                    self.sticky_members.setdefault(guild_id, set()).add(member_id)
+        self.set_ping_log_size(await self.config.ping_log_size())
+        self.notify_cooldown = await self.config.notify_cooldown()
+        self.flush_ping_logs_loop.start()
+
+    def set_ping_log_size(self, size: int):
+        """
+        Change the ping log size, buffered pings are trimmed to it as well.
+        """
+        self.ping_log_size = size
+        for key, pings in self.ping_buffer.items():
+            if pings.maxlen != size:
+                self.ping_buffer[key] = deque(pings, maxlen=size)
+
+    async def cog_unload(self):
+        self.flush_ping_logs_loop.cancel()
+        await self.flush_ping_logs()
+
+    async def flush_ping_logs(self):
+        """
+        Save the buffered pings to config, keeping the last `ping_log_size` of each member.
+        """
+        async with self.ping_lock:
+            pending, self.ping_buffer = self.ping_buffer, {}
+            for (guild_id, member_id), pings in pending.items():
+                try:
+                    async with self.config.member_from_ids(
+                        guild_id, member_id
+                    ).pinglogs() as pl:
+                        pl.extend(list(p) for p in pings)
+                        del pl[: -self.ping_log_size]
+                except Exception as e:
+                    self.log.exception(str(e), exc_info=e)
+
+    @tasks.loop(seconds=15)
+    async def flush_ping_logs_loop(self):
+        await self.flush_ping_logs()
+
+    @flush_ping_logs_loop.before_loop
+    async def before_flush_ping_logs_loop(self):
+        await self.bot.wait_until_red_ready()
+
+    async def resolve_users(
+        self, guild: discord.Guild, user_ids: Iterable[int]
+    ) -> Dict[int, Optional[Union[discord.Member, discord.User]]]:
+        """
+        Resolve user IDs from the guild, the cog's user cache or the bot's cache,
+        and fetch the rest at most 5 at a time.
+
+        Deleted users resolve to None.
+        """
+        resolved = {}
+        to_fetch = []
+        for user_id in set(user_ids):
+            if user_id is None:
+                continue
+            if member := guild.get_member(user_id):
+                resolved[user_id] = member
+            elif user_id in self.user_cache:
+                self.user_cache.move_to_end(user_id)
+                resolved[user_id] = self.user_cache[user_id]
+            elif user := self.bot.get_user(user_id):
+                resolved[user_id] = user
+            else:
+                to_fetch.append(user_id)
+
+        semaphore = asyncio.Semaphore(5)
+
+        async def fetch(user_id: int):
+            async with semaphore:
+                try:
+                    user = await self.bot.fetch_user(user_id)
+                except discord.errors.NotFound:
+                    user = None
+                except discord.errors.HTTPException:
+                    resolved[user_id] = None
+                    return
+            resolved[user_id] = self.user_cache[user_id] = user
+            if len(self.user_cache) > self.user_cache_size:
+                self.user_cache.popitem(last=False)
+
+        await asyncio.gather(*(fetch(user_id) for user_id in to_fetch))
+        return resolved
+
+    @staticmethod
+    def to_ping_log(entry: Union[list, dict]) -> PingLog:
+        """
+        Get a stored ping as a tuple, including pings saved as dicts by older versions.
+        """
+        if isinstance(entry, dict):
+            return (
+                entry["pinger_id"],
+                entry["channel_id"],
+                int(entry["jump_url"].rsplit("/", 1)[-1]),
+                entry["timestamp"],
+                entry["message"],
+            )
+        return tuple(entry)
+
+    def update_index(
+        self, index: Dict[int, Set[int]], guild_id: int, member_id: int, state: bool
+    ):
+        """
+        Add or remove a member from one of the in-memory AFK or sticky indexes.
+        """
+        if state:
+            index.setdefault(guild_id, set()).add(member_id)
+        elif members := index.get(guild_id):
+            members.discard(member_id)
+            if not members:
+                del index[guild_id]
+
+    def is_afk(self, member: discord.Member) -> bool:
+        return member.id in self.afk_members.get(member.guild.id, ())
+
+    def is_sticky(self, member: discord.Member) -> bool:
+        return member.id in self.sticky_members.get(member.guild.id, ())
+
     async def red_delete_data_for_user(
         self,
         *,
@@ -67,17 +212,29 @@ class Afk(commands.Cog):
 
         Also thanks sravan and aikaterna for the end user data statement!
         """
+        self.user_cache.pop(user_id, None)
         for g in (await self.config.all_guilds()).keys():
             if guild := self.bot.get_guild(g):
                 guild_data = await self.config.all_members(guild)
                 if user_id in guild_data.keys():
                     await self.config.member_from_ids(guild.id, user_id).clear()
+                    self.update_index(self.afk_members, guild.id, user_id, False)
+                    self.update_index(self.sticky_members, guild.id, user_id, False)
                 async with self.config.member_from_ids(guild.id, user_id).pinglogs() as pl:
                     if not pl:
                         continue
-                    for i in pl:
-                        if i["pinger_id"] == user_id:
-                            i["pinger_id"] = None
+                    for index, i in enumerate(pl):
+                        i = self.to_ping_log(i)
+                        if i[0] == user_id:
+                            pl[index] = [None, *i[1:]]
+        self.ping_buffer = {
+            key: deque(
+                ((None, *p[1:]) if p[0] == user_id else p for p in pings),
+                maxlen=self.ping_log_size,
+            )
+            for key, pings in self.ping_buffer.items()
+            if key[1] != user_id
+        }
 
     async def start_afk(
         self, message: discord.Message, user: discord.Member, reason: str
@@ -86,6 +243,7 @@ class Afk(commands.Cog):
         Start AFK status.
         """
         await self.config.member(user).afk.set(True)
+        self.update_index(self.afk_members, user.guild.id, user.id, True)
         await self.config.member(user).timestamp.set(
             round(discord.utils.utcnow().timestamp())
         )
@@ -123,6 +281,8 @@ class Afk(commands.Cog):
             content=f"Welcome back {user.name}! I have removed your AFK status."
         )
         await self.config.member(user).afk.set(False)
+        self.update_index(self.afk_members, user.guild.id, user.id, False)
+        self.notified.pop(user.id, None)
         await self.config.member(user).timestamp.clear()
         await self.config.member(user).reason.clear()
         channel = message.channel
@@ -151,17 +311,24 @@ class Afk(commands.Cog):
                     content="It seems your nick name is too long for me to add '[AFK]' beside it."
                 )
 
-        if pings := await self.config.member(user).pinglogs():
+        async with self.ping_lock:
+            pings = [
+                self.to_ping_log(i) for i in await self.config.member(user).pinglogs()
+            ]
+            pings.extend(self.ping_buffer.pop((guild.id, user.id), ()))
+            await self.config.member(user).pinglogs.clear()
+        if pings := pings[-self.ping_log_size :]:
+            users = await self.resolve_users(guild, (p[0] for p in pings))
             final_log = []
-            for i in pings:
-                try:
-                    member = await self.bot.get_or_fetch_user(i["pinger_id"])
+            for pinger_id, channel_id, message_id, timestamp, content in pings:
+                if member := users.get(pinger_id):
                     m = member.mention
-                except (discord.errors.NotFound, discord.errors.HTTPException):
+                else:
                     m = "||Unknown or Deleted User||"
+                jump_url = f"https://discord.com/channels/{guild.id}/{channel_id}/{message_id}"
                 logs = (
-                    f"` #{len(final_log) + 1} ` {m} [pinged you in]({i['jump_url']}) <#{i['channel_id']}>"
-                    f" <t:{i['timestamp']}:R>.\n**Message:** {i['message']}"
+                    f"` #{len(final_log) + 1} ` {m} [pinged you in]({jump_url}) <#{channel_id}>"
+                    f" <t:{timestamp}:R>.\n**Message:** {content}"
                 )
                 final_log.append(logs)
 
@@ -175,81 +342,148 @@ class Afk(commands.Cog):
                 footer_icon=nu.is_have_avatar(user),
             )
             context = await self.bot.get_context(message)
-            await self.config.member(user).pinglogs.clear()
             await nu.NoobPaginator(final_page, timeout=60.0).start(context)
 
+    def should_notify(self, channel_id: int, afk_user_id: int) -> bool:
+        """
+        Check if an AFK member was not already announced in the channel within the notify cooldown.
+
+        The notice is recorded right away, `unmark_notified` takes it back if it could not be sent.
+        """
+        now = time.monotonic()
+        channels = self.notified.setdefault(afk_user_id, {})
+        last = channels.get(channel_id)
+        if last is not None and now - last < self.notify_cooldown:
+            return False
+        if len(channels) > 100:
+            for expired in [
+                k for k, v in channels.items() if now - v >= self.notify_cooldown
+            ]:
+                del channels[expired]
+        channels[channel_id] = now
+        return True
+
+    def unmark_notified(self, channel_id: int, afk_user_ids: List[int]):
+        for afk_user_id in afk_user_ids:
+            if channels := self.notified.get(afk_user_id):
+                channels.pop(channel_id, None)
+                if not channels:
+                    del self.notified[afk_user_id]
+
     async def maybe_log_and_notify(
-        self, message: discord.Message, afk_user: discord.Member
+        self, message: discord.Message, afk_users: List[discord.Member]
     ):
         """
-        Log pings and at the same time notify members when they mentioned an AFK memebr.
-        """
-        if await self.config.member(afk_user).toggle_logs():
-            async with self.config.member(afk_user).pinglogs() as ping_logs:
-                pl: list = ping_logs
-                dict_log = {
-                    "pinger_id": message.author.id,
-                    "jump_url": message.jump_url,
-                    "channel_id": message.channel.id,
-                    "timestamp": round(discord.utils.utcnow().timestamp()),
-                    "message": message.content,
-                }
-                pl.append(dict_log)
-
-        afk_reason = await self.config.member(afk_user).reason()
-        timestamp = await self.config.member(afk_user).timestamp()
-        embed = discord.Embed(
-            description=f"{afk_user.mention} is currently AFK since <t:{timestamp}:R>.\n\n"
-            f"**Reason:**\n{afk_reason}",
-            colour=afk_user.colour,
-        ).set_thumbnail(url=nu.is_have_avatar(afk_user))
+        Log pings and at the same time notify members when they mentioned AFK members.
+
+        All the AFK members mentioned in a message are notified in one embed.
+        """
+        content = message.content
+        if len(content) > self.max_ping_content:
+            content = f"{content[: self.max_ping_content - 3]}..."
+        notices = []
+        for afk_user in afk_users:
+            member_data = await self.config.member(afk_user).all()
+            if member_data["toggle_logs"]:
+                self.ping_buffer.setdefault(
+                    (message.guild.id, afk_user.id), deque(maxlen=self.ping_log_size)
+                ).append(
+                    (
+                        message.author.id,
+                        message.channel.id,
+                        message.id,
+                        round(discord.utils.utcnow().timestamp()),
+                        content,
+                    )
+                )
+            if self.should_notify(message.channel.id, afk_user.id):
+                notices.append((afk_user, member_data))
+
+        if not notices:
+            return
+        if len(notices) == 1:
+            afk_user, member_data = notices[0]
+            embed = discord.Embed(
+                description=f"{afk_user.mention} is currently AFK since <t:{member_data['timestamp']}:R>.\n\n"
+                f"**Reason:**\n{member_data['reason']}",
+                colour=afk_user.colour,
+            ).set_thumbnail(url=nu.is_have_avatar(afk_user))
+        else:
+            description = "\n\n".join(
+                f"{afk_user.mention} is currently AFK since <t:{member_data['timestamp']}:R>.\n"
+                f"**Reason:** {member_data['reason']}"
+                for afk_user, member_data in notices
+            )
+            embed = discord.Embed(
+                description=description
+                if len(description) <= 4096
+                else f"{description[:4093]}...",
+                colour=notices[0][0].colour,
+            )
 
         da = await self.config.delete_after()
 
-        return (
-            await message.channel.send(
-                embed=embed, reference=message, mention_author=False, delete_after=da
-            )
-            if da != 0
-            else await message.channel.send(
-                embed=embed, reference=message, mention_author=False
+        try:
+            return (
+                await message.channel.send(
+                    embed=embed, reference=message, mention_author=False, delete_after=da
+                )
+                if da != 0
+                else await message.channel.send(
+                    embed=embed, reference=message, mention_author=False
+                )
             )
-        )
+        except discord.errors.HTTPException:
+            self.unmark_notified(message.channel.id, [u.id for u, _ in notices])
+            raise
 
     @commands.Cog.listener("on_member_remove")
     async def m_remove(self, member: discord.Member):
         guild_data = await self.config.all_members(member.guild)
         if member.id in guild_data.keys():
+            self.update_index(self.afk_members, member.guild.id, member.id, False)
+            self.ping_buffer.pop((member.guild.id, member.id), None)
+            self.notified.pop(member.id, None)
             if await self.config.member_from_ids(member.guild.id, member.id).afk():
                 await self.config.member_from_ids(member.guild.id, member.id).afk.clear()
                 await self.config.member_from_ids(member.guild.id, member.id).timestamp.clear()
                 await self.config.member_from_ids(member.guild.id, member.id).reason.clear()
                 await self.config.member_from_ids(member.guild.id, member.id).pinglogs.clear()
 
+    async def is_afk_command(self, message: discord.Message) -> bool:
+        """
+        Check if the message invokes the afk command with any of the bot's prefixes.
+        """
+        prefixes = await self.bot.get_prefix(message)
+        if isinstance(prefixes, str):
+            prefixes = [prefixes]
+        return message.content.startswith(
+            tuple(f"{p}{cmd}" for p in prefixes for cmd in ("afk", "away"))
+        )
+
     @commands.Cog.listener("on_message")
     async def afk_listener(self, message: discord.Message):
-        context: commands.Context = await self.bot.get_context(message)
-        tuple_cmds = (f"{context.prefix}afk", f"{context.prefix}away")
-        if not message.guild:
-            return
-        if not message.channel.permissions_for(message.guild.me).send_messages:
+        if not message.guild or message.author.bot:
             return
-        if message.author.bot:
+        if not self.afk_members.get(message.guild.id):
             return
-        if await self.bot.cog_disabled_in_guild(cog=self, guild=message.guild):
+        afk_users = [
+            afk_user
+            for afk_user in message.mentions
+            if afk_user != message.author
+            and isinstance(afk_user, discord.Member)
+            and self.is_afk(afk_user)
+        ]
+        back = self.is_afk(message.author) and not self.is_sticky(message.author)
+        if not afk_users and not back:
             return
-        if message.mentions:
-            for afk_user in message.mentions:
-                if (
-                    afk_user != message.author
-                    and await self.config.member(afk_user).afk()
-                ):
-                    await self.maybe_log_and_notify(message=message, afk_user=afk_user)
-        if message.content.startswith(tuple_cmds):
+        if not message.channel.permissions_for(message.guild.me).send_messages:
             return
-        if await self.config.member(message.author).sticky():
+        if await self.bot.cog_disabled_in_guild(cog=self, guild=message.guild):
             return
-        if await self.config.member(message.author).afk():
+        if afk_users:
+            await self.maybe_log_and_notify(message=message, afk_users=afk_users)
+        if back and not await self.is_afk_command(message):
             await self.end_afk(message=message, user=message.author)
 
     @commands.hybrid_command(name="afk", aliases=["away"])
@@ -310,6 +544,61 @@ class Afk(commands.Cog):
             content=f"Successfully set the delete after to {seconds} seconds."
         )
 
+    @afkset.command(name="notifycooldown", aliases=["nc"])
+    @commands.is_owner()
+    async def afkset_notifycooldown(
+        self, context: commands.Context, seconds: int = None
+    ):
+        """
+        Change how long an AFK member is not announced again in the same channel.
+
+        Pings are still logged while the notice is on cooldown.
+        Leave `seconds` blank to disable.
+        Default is 30 seconds.
+        """
+        if not seconds:
+            await self.config.notify_cooldown.set(0)
+            self.notify_cooldown = 0
+            return await context.send(content="The notify cooldown has been disabled.")
+
+        if seconds < 0:
+            return await context.send(
+                content="You can not set the notify cooldown lower than 0."
+            )
+        if seconds > 600:
+            return await context.send(
+                content="The maximum seconds of notify cooldown is 600 seconds."
+            )
+
+        await self.config.notify_cooldown.set(seconds)
+        self.notify_cooldown = seconds
+        await context.send(
+            content=f"Successfully set the notify cooldown to {seconds} seconds."
+        )
+
+    @afkset.command(name="pinglogsize", aliases=["pls"])
+    @commands.is_owner()
+    async def afkset_pinglogsize(self, context: commands.Context, size: int = None):
+        """
+        Change how many pings are logged per AFK member.
+
+        Only the latest pings are kept once a member goes over it.
+        Leave `size` blank to see the current size. Default is 100 pings.
+        """
+        if not size:
+            return await context.send(
+                content=f"Up to {self.ping_log_size} pings are logged per AFK member."
+            )
+        if size < 10 or size > 500:
+            return await context.send(
+                content="The ping log size must be between 10 and 500."
+            )
+        await self.config.ping_log_size.set(size)
+        self.set_ping_log_size(size)
+        await context.send(
+            content=f"Up to {size} pings will now be logged per AFK member."
+        )
+
     @afkset.command(name="forceafk", aliases=["forceaway"])
     @commands.admin_or_permissions(manage_guild=True)
     async def afkset_forceafk(
@@ -407,6 +696,14 @@ class Afk(commands.Cog):
 
         if view.value:
             await self.config.member(context.author).clear()
+            self.update_index(
+                self.afk_members, context.guild.id, context.author.id, False
+            )
+            self.update_index(
+                self.sticky_members, context.guild.id, context.author.id, False
+            )
+            self.ping_buffer.pop((context.guild.id, context.author.id), None)
+            self.notified.pop(context.author.id, None)
 
     @afkset.command(name="resetcog")
     @commands.is_owner()
@@ -427,6 +724,13 @@ class Afk(commands.Cog):
             await self.config.clear_all()
             await self.config.clear_all_guilds()
             await self.config.clear_all_members()
+            self.afk_members.clear()
+            self.sticky_members.clear()
+            self.ping_buffer.clear()
+            self.set_ping_log_size(100)
+            self.user_cache.clear()
+            self.notify_cooldown = 30
+            self.notified.clear()
 
     @afkset.command(name="showsettings", aliases=["ss"])
     async def afkset_showsettings(self, context: commands.Context):
@@ -444,7 +748,15 @@ class Afk(commands.Cog):
             else "Disabled."
         )
         aset = f"`Nick change:` {guild_settings['nick']}"
-        globe = f"`Delete after:` {da}"
+        nc = (
+            f"{self.notify_cooldown} seconds."
+            if self.notify_cooldown != 0
+            else "Disabled."
+        )
+        globe = (
+            f"`Delete after:` {da}\n`Notify cooldown:` {nc}\n"
+            f"`Ping log size:` {self.ping_log_size} pings."
+        )
 
         embed = discord.Embed(
             title=f"{context.author.name}'s AFK settings.",
@@ -460,7 +772,7 @@ class Afk(commands.Cog):
         ):
             embed.add_field(name="Guild settings:", value=aset, inline=False)
         if await context.bot.is_owner(context.author):
-            embed.add_field(name="Delete After:", value=globe, inline=False)
+            embed.add_field(name="Global settings:", value=globe, inline=False)
         await context.send(embed=embed)
 
     @afkset.command(name="sticky")
@@ -472,6 +784,9 @@ class Afk(commands.Cog):
         """
         current = await self.config.member(context.author).sticky()
         await self.config.member(context.author).sticky.set(not current)
+        self.update_index(
+            self.sticky_members, context.guild.id, context.author.id, not current
+        )
         status = "will not" if current else "will now"
         await context.send(content=f"I {status} sticky your AFK.")
 
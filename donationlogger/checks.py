@@ -17,7 +17,7 @@ async def check_if_setup_done(
         if isinstance(obj, commands.Context)
         else obj.client.get_cog("DonationLogger")
     )
-    return await cog.config.guild(obj.guild).setup() if obj.guild else False
+    return (await cog.get_guild_settings(obj.guild))["setup"] if obj.guild else False
 
 
 def is_setup_done():
@@ -37,12 +37,12 @@ async def check_if_is_a_dono_manager_or_higher(
         author = obj.user
         bot = obj.client
     cog: "DonationLogger" = bot.get_cog("DonationLogger")
-    managers = await cog.config.guild(obj.guild).managers()
+    managers = (await cog.get_guild_settings(obj.guild))["managers"]
     return (
-        await bot.is_owner(author)
-        or author.guild_permissions.manage_guild
-        or await mod.is_mod_or_superior(bot, author)
+        author.guild_permissions.manage_guild
         or any(role_id in author._roles for role_id in managers)
+        or await bot.is_owner(author)
+        or await mod.is_mod_or_superior(bot, author)
         or False
     )
 
@@ -73,8 +73,7 @@ class BankConverter(app_commands.Transformer):
     @classmethod
     async def convert(cls, ctx: commands.Context, argument: str) -> str:
         cog: "DonationLogger" = ctx.bot.get_cog("DonationLogger")
-        banks = await cog.config.guild(ctx.guild).banks()
-        if not banks.get(argument.strip().lower()):
+        if argument.strip().lower() not in await cog.get_bank_index(ctx.guild):
             raise BankConversionFailure(f'Bank "{argument}" does not exist.')
         return argument.strip().lower()
 
@@ -102,12 +101,12 @@ class BankConverter(app_commands.Transformer):
         self, interaction: discord.Interaction[Red], value: int | float | str
     ) -> List[app_commands.Choice[str | int | float]]:
         cog: "DonationLogger" = interaction.client.get_cog("DonationLogger")
-        banks = await cog.config.guild(interaction.guild).banks()
-        bank_list: List[str] = [
-            bank for bank, bank_info in banks.items() if not bank_info["hidden"]
-        ]
+        banks = await cog.get_bank_index(interaction.guild)
+        value = str(value).strip().lower()
+        bank_list: List[str] = [bank for bank, hidden in banks.items() if not hidden]
+        prefixed = [bank for bank in bank_list if bank.startswith(value)]
+        fuzzy = [bank for bank in bank_list if value in bank and bank not in prefixed]
         return [
             app_commands.Choice(name=choice.title(), value=choice)
-            for choice in bank_list
-            if value.lower() in choice.lower()
+            for choice in (prefixed + fuzzy)[:25]
         ]
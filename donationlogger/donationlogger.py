@@ -1,17 +1,22 @@
+import asyncio
 import discord
 import noobutils as nu
 import logging
 
 from redbot.core.bot import app_commands, commands, Config, Red
+from redbot.core.data_manager import cog_data_path
 from redbot.core.utils import chat_formatting as cf, mod
 
-from typing import Dict, Literal, List, Optional
+from discord.ext import tasks
+from typing import Any, Dict, Literal, List, Optional, Tuple, Union
 
 from .checks import is_a_dono_manager_or_higher, is_setup_done
 from .converters import AmountConverter, BankConverter, DLEmojiConverter
-from .exceptions import MoreThanThreeRoles
+from .exceptions import AmountConversionFailure, BankConversionFailure, MoreThanThreeRoles
 from .hybrids import HYBRIDS
-from .utilities import verify_amount_roles
+from .journal import DonationJournal, window_start
+from .ledger import DonationLedger
+from .utilities import AmountRoleTable, verify_amount_roles
 
 
 class DonationLogger(commands.Cog):
@@ -36,10 +41,18 @@ class DonationLogger(commands.Cog):
             "setup": False,
         }
         self.config.register_guild(**default_guild)
+        self.config.register_global(flush_interval=60)
+        self.config.init_custom("DONATIONS", 3)
+        self.config.register_custom("DONATIONS", amount=0)
         self.log = logging.getLogger("red.NoobCogs.DonationLogger")
+        self.ledger = DonationLedger(self.config)
+        self.journal = DonationJournal(cog_data_path(self) / "journal")
+        self.amountroles_cache: Dict[int, Dict[str, AmountRoleTable]] = {}
+        self.settings_cache: Dict[int, Dict[str, Any]] = {}
+        self.bank_index: Dict[int, Dict[str, bool]] = {}
         self.setupcache = []
 
-    __version__ = "1.3.5"
+    __version__ = "1.4.0"
     __author__ = ["NoobInDaHause"]
     __docs__ = "https://github.com/NoobInDaHause/NoobCogs/blob/red-3.5/donationlogger/README.md"
 
@@ -63,13 +76,51 @@ class DonationLogger(commands.Cog):
 
         Users can remove their data at anytime.
         """
-        for g in (await self.config.all_guilds()).keys():
-            async with self.config.guild_from_id(g).banks() as banks:
-                for bank in banks.values():
-                    try:
-                        del bank["donators"][str(user_id)]
-                    except KeyError:
-                        continue
+        await self.ledger.clear_user(user_id)
+        self.journal.clear_user(user_id)
+
+    async def cog_load(self):
+        await self.ledger.initialize()
+        await self.migrate_donators()
+        await self.journal.initialize()
+        for guild_id, guild_data in self.ledger.cache.items():
+            if not self.journal.has_guild(guild_id):
+                self.journal.seed(guild_id, guild_data)
+        self.flush_ledger_loop.change_interval(
+            seconds=await self.config.flush_interval()
+        )
+        self.flush_ledger_loop.start()
+
+    async def cog_unload(self):
+        self.flush_ledger_loop.cancel()
+        await self.ledger.flush()
+        await self.journal.flush()
+        self.log.info("Flush ledger loop task cancelled and ledger flushed.")
+
+    @tasks.loop(seconds=60)
+    async def flush_ledger_loop(self):
+        try:
+            await self.ledger.flush()
+            await self.journal.flush()
+        except Exception as e:
+            self.log.exception("Error flushing the donation ledger.", exc_info=e)
+
+    @flush_ledger_loop.before_loop
+    async def flush_ledger_before_loop(self):
+        await self.bot.wait_until_red_ready()
+
+    async def migrate_donators(self):
+        """
+        Move donors out of the old per-guild `banks` blob into the ledger.
+        """
+        for guild_id, guild_data in (await self.config.all_guilds()).items():
+            if not any("donators" in bank for bank in guild_data["banks"].values()):
+                continue
+            async with self.config.guild_from_id(guild_id).banks() as banks:
+                for bank_name, bank in banks.items():
+                    if donators := bank.pop("donators", None):
+                        await self.ledger.import_bank(guild_id, bank_name, donators)
+            self.log.info(f"Migrated donators of guild {guild_id} to the ledger.")
 
     async def get_dc_from_bank(
         self, context: commands.Context, bank_name: str
@@ -80,9 +131,7 @@ class DonationLogger(commands.Cog):
         if not bank_info or bank_info["hidden"]:
             return []
 
-        sorted_donators = sorted(
-            bank_info["donators"].items(), key=lambda x: x[1], reverse=True
-        )
+        sorted_donators = self.ledger.ranking(context.guild.id, bank_name).top()
 
         final = []
         for index, (k, v) in enumerate(sorted_donators, 1):
@@ -103,18 +152,29 @@ class DonationLogger(commands.Cog):
             footer_icon=nu.is_have_avatar(context.guild),
         )
 
+    def get_member_balances(
+        self, guild: discord.Guild, member: discord.Member
+    ) -> Dict[str, int]:
+        """
+        Get a member's balance on every bank they have donated to.
+
+        This is read-only and served from memory, it never touches Config.
+        """
+        return self.ledger.member_balances(guild.id, member.id)
+
     async def get_all_bank_member_dono(
         self, guild: discord.Guild, member: discord.Member
     ) -> discord.Embed:
         final: Dict[str, str] = {}
         final_overall = []
-        async with self.config.guild(guild).banks() as banks:
-            for k, v in banks.items():
-                if v["hidden"]:
-                    continue
-                donations = v["donators"].setdefault(str(member.id), 0)
-                final[k] = f"{v['emoji']} {cf.humanize_number(donations)}"
-                final_overall.append(donations)
+        banks = await self.config.guild(guild).banks()
+        balances = self.get_member_balances(guild, member)
+        for k, v in banks.items():
+            if v["hidden"]:
+                continue
+            donations = balances.get(k, 0)
+            final[k] = f"{v['emoji']} {cf.humanize_number(donations)}"
+            final_overall.append(donations)
 
         overall = sum(final_overall)
         embed = discord.Embed(
@@ -138,18 +198,178 @@ class DonationLogger(commands.Cog):
             )
         return embed
 
+    async def get_guild_settings(self, guild: discord.Guild) -> Dict[str, Any]:
+        """
+        Get the guild's setup flag, managers, log channel and auto role from memory.
+        """
+        if guild.id not in self.settings_cache:
+            settings = self.config.guild(guild)
+            self.settings_cache[guild.id] = {
+                "setup": await settings.setup(),
+                "managers": await settings.managers(),
+                "log_channel": await settings.log_channel(),
+                "auto_role": await settings.auto_role(),
+            }
+        return self.settings_cache[guild.id]
+
+    def invalidate_settings(self, guild_id: int = None):
+        if guild_id:
+            self.settings_cache.pop(guild_id, None)
+        else:
+            self.settings_cache.clear()
+
+    async def get_bank_index(self, guild: discord.Guild) -> Dict[str, bool]:
+        """
+        Get the guild's bank names mapped to whether they are hidden.
+        """
+        if guild.id not in self.bank_index:
+            banks = await self.config.guild(guild).banks()
+            self.bank_index[guild.id] = {k: v["hidden"] for k, v in banks.items()}
+        return self.bank_index[guild.id]
+
+    def invalidate_bank_index(self, guild_id: int = None):
+        if guild_id:
+            self.bank_index.pop(guild_id, None)
+        else:
+            self.bank_index.clear()
+
+    async def get_amount_role_table(
+        self, guild: discord.Guild, bank_name: str
+    ) -> AmountRoleTable:
+        tables = self.amountroles_cache.setdefault(guild.id, {})
+        if bank_name not in tables:
+            banks = await self.config.guild(guild).banks()
+            tables[bank_name] = AmountRoleTable(banks[bank_name]["roles"])
+        return tables[bank_name]
+
+    def invalidate_amount_roles(self, guild_id: int, bank_name: str = None):
+        if bank_name:
+            self.amountroles_cache.get(guild_id, {}).pop(bank_name, None)
+        else:
+            self.amountroles_cache.pop(guild_id, None)
+
     async def update_dono_roles(
         self,
         context: commands.Context,
         d_type: str,
         donated_amount: int,
         member: discord.Member,
-        roles: Dict[str, List[int]],
+        bank_name: str,
     ) -> List[discord.Role]:
-        if not await self.config.guild(context.guild).auto_role():
+        if not (await self.get_guild_settings(context.guild))["auto_role"]:
             return []
+        return await self.modify_dono_roles(
+            context.guild, context.author, d_type, donated_amount, member, bank_name
+        )
+
+    async def apply_donation(
+        self,
+        guild: discord.Guild,
+        bank_name: str,
+        member: discord.Member,
+        delta: int,
+        note: str = None,
+        actor: Optional[Union[discord.Member, discord.User]] = None,
+    ) -> Tuple[int, int]:
+        """
+        Add to or remove from a member's bank donations without invoking a command.
+
+        For other cogs, e.g. `await cog.apply_donation(guild, "main", member, 5000)`.
+        Positive amounts get the bank's multiplier like `[p]dono add`, balances never go below 0.
+        Only the balance, donation history and donation roles are updated, nothing is sent.
+
+        Role edits that fail are logged instead of raised.
+
+        Returns the previous and the updated balance.
+        Raises `BankConversionFailure` if the bank does not exist or is hidden,
+        and `AmountConversionFailure` if the amount is way too high.
+        """
+        bank_name = bank_name.lower()
+        banks = await self.get_bank_index(guild)
+        if bank_name not in banks:
+            raise BankConversionFailure(f'Bank "{bank_name}" does not exist.')
+        if banks[bank_name]:
+            raise BankConversionFailure(f'Bank "{bank_name}" is hidden.')
+        if delta > 0:
+            bank = await self.config.guild(guild).banks.get_raw(bank_name)
+            if multi := bank.get("multi"):
+                delta = round(delta * multi)
+        if abs(delta) > 999999999999999:
+            raise AmountConversionFailure("The amount provided is way too high.")
+        previous, updated = await self.ledger.add(guild.id, bank_name, member.id, delta)
+        if updated == previous:
+            return previous, updated
+        self.journal.record(
+            guild.id,
+            "add" if delta >= 0 else "remove",
+            bank_name,
+            member.id,
+            actor.id if actor else None,
+            updated - previous,
+            updated,
+            note,
+        )
+        if (await self.get_guild_settings(guild))["auto_role"]:
+            try:
+                await self.modify_dono_roles(
+                    guild,
+                    actor or guild.me,
+                    "add" if delta >= 0 else "remove",
+                    updated,
+                    member,
+                    bank_name,
+                )
+            except discord.errors.HTTPException as e:
+                self.log.exception(
+                    f"Failed to update donation roles of {member.id}.", exc_info=e
+                )
+        return previous, updated
+
+    async def bulk_update_dono_roles(
+        self,
+        context: commands.Context,
+        d_type: str,
+        members: Dict[discord.Member, int],
+        bank_name: str,
+    ) -> Dict[discord.Member, List[discord.Role]]:
+        """
+        Update the donation roles of many members at once, a few at a time.
+        """
+        if not (await self.get_guild_settings(context.guild))["auto_role"]:
+            return {}
+        semaphore = asyncio.Semaphore(5)
+
+        async def modify(member: discord.Member, donated_amount: int):
+            async with semaphore:
+                try:
+                    return member, await self.modify_dono_roles(
+                        context.guild,
+                        context.author,
+                        d_type,
+                        donated_amount,
+                        member,
+                        bank_name,
+                    )
+                except discord.errors.HTTPException as e:
+                    self.log.exception(
+                        f"Failed to update donation roles of {member.id}.", exc_info=e
+                    )
+                    return member, []
+
+        results = await asyncio.gather(*(modify(m, a) for m, a in members.items()))
+        return {member: modified for member, modified in results if modified}
+
+    async def modify_dono_roles(
+        self,
+        guild: discord.Guild,
+        author: Union[discord.Member, discord.User],
+        d_type: str,
+        donated_amount: int,
+        member: discord.Member,
+        bank_name: str,
+    ) -> List[discord.Role]:
         audit_reason = mod.get_audit_reason(
-            author=context.author,
+            author=author,
             reason=(
                 "Automatically added donation roles on member after reaching a donation milestone."
                 if d_type == "add"
@@ -160,23 +380,16 @@ class DonationLogger(commands.Cog):
             ),
         )
         action = member.add_roles if d_type == "add" else member.remove_roles
-        roles_to_modify: List[discord.Role] = []
-        for k, v in roles.items():
-            for r in v:
-                role = context.guild.get_role(r)
-                if role and (
-                    (
-                        d_type == "add"
-                        and donated_amount >= int(k)
-                        and role not in member.roles
-                    )
-                    or (
-                        d_type == "remove"
-                        and donated_amount < int(k)
-                        and role in member.roles
-                    )
-                ):
-                    roles_to_modify.append(role)
+        table = await self.get_amount_role_table(guild, bank_name)
+        member_roles = set(member._roles)
+        role_ids = (
+            table.to_add(donated_amount, member_roles)
+            if d_type == "add"
+            else table.to_remove(donated_amount, member_roles)
+        )
+        roles_to_modify: List[discord.Role] = [
+            role for r in role_ids if (role := guild.get_role(r))
+        ]
 
         if not roles_to_modify:
             return []
@@ -197,7 +410,8 @@ class DonationLogger(commands.Cog):
         roles: str = None,
         note: str = None,
     ):
-        logchan = await self.config.guild(context.guild).log_channel()
+        settings = await self.get_guild_settings(context.guild)
+        logchan = settings["log_channel"]
         if not logchan:
             return
 
@@ -253,7 +467,7 @@ class DonationLogger(commands.Cog):
 
         if roles:
             embed.add_field(name=ra, value=roles, inline=False)
-        elif not await self.config.guild(context.guild).auto_role():
+        elif not settings["auto_role"]:
             embed.add_field(
                 name=ra,
                 value=f"> Autorole is currently disabled. `{context.prefix}dlset autorole`",
@@ -274,6 +488,64 @@ class DonationLogger(commands.Cog):
                 view=view,
             )
 
+    async def send_bulk_to_log_channel(
+        self,
+        context: commands.Context,
+        bank_name: str,
+        emoji: str,
+        results: List[Dict[str, Union[discord.Member, int]]],
+        roles: Dict[discord.Member, List[discord.Role]],
+        note: str = None,
+    ):
+        logchan = (await self.get_guild_settings(context.guild))["log_channel"]
+        if not logchan:
+            return
+
+        channel = context.guild.get_channel(logchan)
+        total = sum(r["amount"] for r in results)
+        lines = []
+        for r in results:
+            member: discord.Member = r["member"]
+            line = (
+                f"{member.mention} (`{member.id}`): +{emoji} {cf.humanize_number(r['amount'])} "
+                f"({cf.humanize_number(r['previous'])} ➜ {cf.humanize_number(r['updated'])})"
+            )
+            if member_roles := roles.get(member):
+                line += f"\n> Roles Added: {cf.humanize_list([x.mention for x in member_roles])}"
+            lines.append(line)
+
+        header = (
+            f"{emoji} {cf.humanize_number(total)} was added to **{len(results)}** members' "
+            f"donation balance on **{bank_name.title()}**.\n"
+        )
+        if note:
+            header += f"**Note:** {note}\n"
+        embeds = await nu.pagify_this(
+            header + "\n" + "\n".join(lines),
+            "\n",
+            f"Authorized by: {context.author} ({context.author.id}) | Page ({{index}}/{{pages}})",
+            embed_title="**__Bulk Donation Added!__**",
+            embed_colour=await context.embed_colour(),
+            footer_icon=nu.is_have_avatar(context.author),
+        )
+        view = discord.ui.View().add_item(
+            discord.ui.Button(label="Jump To Command", url=context.message.jump_url)
+        )
+
+        try:
+            for embed in embeds:
+                await channel.send(embed=embed, view=view)
+        except Exception:
+            for index, embed in enumerate(embeds):
+                await context.send(
+                    content="⚠️ Warning: `Log channel not found or I do not have permission to "
+                    "send message in the log channel please report this to the admins.`"
+                    if index == 0
+                    else None,
+                    embed=embed,
+                    view=view,
+                )
+
     @commands.group(name="donationlogger", aliases=["d", "dl", "dono", "donolog"])
     @commands.bot_has_permissions(embed_links=True)
     @commands.guild_only()
@@ -298,6 +570,37 @@ class DonationLogger(commands.Cog):
 
         if view.value:
             await self.config.clear_all_guilds()
+            await self.ledger.clear_all()
+            self.journal.clear_all()
+            self.amountroles_cache.clear()
+            self.invalidate_settings()
+            self.invalidate_bank_index()
+
+    @donationlogger.command(name="flushinterval")
+    @commands.is_owner()
+    async def donationlogger_flushinterval(
+        self, context: commands.Context, seconds: int = None
+    ):
+        """
+        Change how often logged donations are saved to config.
+
+        Donations are always saved when the cog is unloaded or the bot shuts down.
+        Leave `seconds` blank to see the current interval. Default is 60 seconds.
+        """
+        if not seconds:
+            current = await self.config.flush_interval()
+            return await context.send(
+                content=f"Donations are saved every {current} seconds."
+            )
+        if seconds < 10 or seconds > 3600:
+            return await context.send(
+                content="The flush interval must be between 10 and 3600 seconds."
+            )
+        await self.config.flush_interval.set(seconds)
+        self.flush_ledger_loop.change_interval(seconds=seconds)
+        await context.send(
+            content=f"Donations will now be saved every {seconds} seconds."
+        )
 
     @donationlogger.command(name="setup")
     @commands.admin_or_permissions(manage_guild=True)
@@ -362,14 +665,68 @@ class DonationLogger(commands.Cog):
     @donationlogger.command(name="leaderboard", aliases=["lb"])
     @is_setup_done()
     async def donationlogger_leaderboard(
-        self, context: commands.Context, bank_name: BankConverter, top: int = 10
+        self,
+        context: commands.Context,
+        bank_name: BankConverter,
+        top: Optional[int] = 10,
+        window: Literal["all", "daily", "weekly", "monthly"] = "all",
     ):
         """
         See who has donated the most from a bank.
+
+        Pass `daily`, `weekly` or `monthly` as the window to rank the donations of
+        today or the last 7 or 30 days (UTC) instead of all time.
         """
         if top > 25 or top < 1:
             return await context.send(content="Top number must be between 1-25.")
-        await HYBRIDS.hybrid_leaderboard(self, context, bank_name, top)
+        await HYBRIDS.hybrid_leaderboard(self, context, bank_name, top, window)
+
+    @donationlogger.command(name="recent")
+    @is_setup_done()
+    async def donationlogger_recent(
+        self, context: commands.Context, bank_name: BankConverter, days: int = 7
+    ):
+        """
+        See who has donated to a bank in the last few days.
+
+        Shows the net donations of each member, defaults to the last 7 days.
+        Days are UTC days and today counts as the first one, like the leaderboard windows.
+        """
+        if days > 365 or days < 1:
+            return await context.send(content="Days must be between 1-365.")
+        banks = await self.get_bank_index(context.guild)
+        if banks[bank_name]:
+            return await context.send(content="This bank is hidden.")
+        totals = self.journal.totals_since(
+            context.guild.id, bank_name, window_start(days)
+        )
+        sorted_donators = sorted(
+            ((k, v) for k, v in totals.items() if v), key=lambda x: x[1], reverse=True
+        )
+        if not sorted_donators:
+            return await context.send(
+                content="Nobody has donated to this bank in the last "
+                f"{days} day{'s' if days > 1 else ''}."
+            )
+
+        final = []
+        for index, (k, v) in enumerate(sorted_donators, 1):
+            member = context.guild.get_member(k)
+            final.append(
+                f"{index}. {member.mention} (`{member.id}`): **{cf.humanize_number(v)}**\n"
+                if member
+                else f"{index}. [Member not found in guild] (`{k}`): **{cf.humanize_number(v)}**\n"
+            )
+        pages = await nu.pagify_this(
+            "\n".join(final),
+            "\n",
+            "".join([f"{context.guild.name}", " | Page ({index}/{pages})"]),
+            embed_title=f"Donations to [{bank_name.title()}] in the last "
+            f"{days} day{'s' if days > 1 else ''}",
+            embed_colour=await context.embed_colour(),
+            footer_icon=nu.is_have_avatar(context.guild),
+        )
+        await nu.NoobPaginator(pages).start(context)
 
     @donationlogger.command(name="add", aliases=["+", "a"])
     @is_setup_done()
@@ -399,6 +756,47 @@ class DonationLogger(commands.Cog):
 
         await HYBRIDS.hybrid_add(self, context, bank_name, amount, member, note)
 
+    @donationlogger.command(name="bulkadd", aliases=["badd"])
+    @is_setup_done()
+    @is_a_dono_manager_or_higher()
+    async def donationlogger_bulkadd(
+        self,
+        context: commands.Context,
+        bank_name: BankConverter,
+        *,
+        entries: str = None,
+    ):
+        """
+        Add bank donations to many members at once.
+
+        Pass `member amount` pairs separated by semicolons or new lines,
+        and/or attach a CSV file with one `member,amount` pair per row (a header row is skipped).
+        Add an optional note after a `|`.
+        Up to 200 members can be added at once.
+        Nothing is added if any of the entries is invalid.
+
+        Example:
+        `[p]dono bulkadd dank @member 10m; 123456789 1,000,000 | Event prizes`
+        """
+        csv_file = (
+            await context.message.attachments[0].read()
+            if context.message.attachments
+            else None
+        )
+        note = None
+        if entries and "|" in entries:
+            entries, _, note = entries.partition("|")
+            note = note.strip() or None
+        if not (entries and entries.strip()) and not csv_file:
+            return await context.send_help()
+        if note and len(note) > 1024:
+            return await context.send(
+                content="Limit your note into 1024 characters due to embed field limits."
+            )
+        await HYBRIDS.hybrid_bulkadd(
+            self, context, bank_name, entries, csv_file, note
+        )
+
     @donationlogger.command(name="remove", aliases=["-", "r"])
     @is_setup_done()
     @is_a_dono_manager_or_higher()
@@ -543,9 +941,9 @@ class DonationLogger(commands.Cog):
                     "hidden": hidden,
                     "emoji": str(emoji),
                     "roles": {},
-                    "donators": {},
                 }
             }
+        self.invalidate_bank_index(context.guild.id)
         await context.send(
             content=f"Added {bank_name} with the emoji {str(emoji)} to the banks list."
         )
@@ -564,6 +962,10 @@ class DonationLogger(commands.Cog):
                     content="This bank is the guild's only bank, you can not remove it."
                 )
             del banks[bank_name]
+        self.invalidate_bank_index(context.guild.id)
+        self.invalidate_amount_roles(context.guild.id, bank_name)
+        await self.ledger.clear_bank(context.guild.id, bank_name)
+        self.journal.clear_bank(context.guild.id, bank_name)
         await context.send(content="That bank is deleted.")
 
     @donationloggerset_bank.command(name="list")
@@ -618,6 +1020,7 @@ class DonationLogger(commands.Cog):
                 banks[bank_name]["roles"] |= {
                     k: [r.id for r in v] for k, v in arole.items()
                 }
+            self.invalidate_amount_roles(context.guild.id, bank_name)
 
             embed = discord.Embed(
                 title="Amount roles has been set.",
@@ -649,6 +1052,7 @@ class DonationLogger(commands.Cog):
         async with self.config.guild(context.guild).banks() as banks:
             try:
                 del banks[bank_name]["roles"][str(amount)]
+                self.invalidate_amount_roles(context.guild.id, bank_name)
                 await context.send(content="That amount has been removed.")
             except KeyError:
                 await context.send(content="You haven't registered that amount yet.")
@@ -686,14 +1090,13 @@ class DonationLogger(commands.Cog):
         """
         Reset a banks donations or amountroles.
         """
-        async with self.config.guild(context.guild).banks() as banks:
-            if roles_or_donators == "amountroles":
-                banks[bank_name]["roles"] = {}
-            elif roles_or_donators == "donators":
-                banks[bank_name]["donators"] = {}
-            else:
+        if roles_or_donators in ["amountroles", "both"]:
+            async with self.config.guild(context.guild).banks() as banks:
                 banks[bank_name]["roles"] = {}
-                banks[bank_name]["donators"] = {}
+            self.invalidate_amount_roles(context.guild.id, bank_name)
+        if roles_or_donators in ["donators", "both"]:
+            await self.ledger.clear_bank(context.guild.id, bank_name)
+            self.journal.clear_bank(context.guild.id, bank_name)
         _type = (
             roles_or_donators
             if roles_or_donators == "amountroles"
@@ -736,8 +1139,9 @@ class DonationLogger(commands.Cog):
                 return await context.send_help()
             async with self.config.guild(context.guild).banks() as banks:
                 banks[bank_name]["hidden"] = hidden == "hide"
-                status = "is now" if hidden == "hide" else "is no longer"
-                await context.send(content=f"Bank **{bank_name}** {status} hidden.")
+            self.invalidate_bank_index(context.guild.id)
+            status = "is now" if hidden == "hide" else "is no longer"
+            await context.send(content=f"Bank **{bank_name}** {status} hidden.")
         else:
             all_banks = await self.config.guild(context.guild).banks()
             banks = {k: v for k, v in all_banks.items() if v["hidden"]}
@@ -796,6 +1200,7 @@ class DonationLogger(commands.Cog):
                     else:
                         managers.remove(role.id)
                     success.append(role.mention)
+            self.invalidate_settings(context.guild.id)
             _type = "added" if add_remove_list == "add" else "removed"
             _type2 = "to" if add_remove_list == "add" else "from"
             if success:
@@ -818,8 +1223,10 @@ class DonationLogger(commands.Cog):
         """
         if not channel:
             await self.config.guild(context.guild).log_channel.clear()
+            self.invalidate_settings(context.guild.id)
             return await context.send(content="The log channel has been cleared.")
         await self.config.guild(context.guild).log_channel.set(channel.id)
+        self.invalidate_settings(context.guild.id)
         await context.send(content=f"Set {channel.mention} as the log channel.")
 
     @donationloggerset.command(name="resetguild")
@@ -834,6 +1241,57 @@ class DonationLogger(commands.Cog):
         await view.wait()
         if view.value:
             await self.config.guild(context.guild).clear()
+            await self.ledger.clear_guild(context.guild.id)
+            self.journal.clear_guild(context.guild.id)
+            self.invalidate_amount_roles(context.guild.id)
+            self.invalidate_settings(context.guild.id)
+            self.invalidate_bank_index(context.guild.id)
+
+    @donationloggerset.command(name="rebuildbalances")
+    async def donationloggerset_rebuildbalances(self, context: commands.Context):
+        """
+        Rebuild the banks' donation balances from the donation history.
+
+        Use this if the saved balances ever got out of sync with the logged donations.
+        Banks without any donation history are left untouched.
+        """
+        if not self.journal.has_guild(context.guild.id):
+            return await context.send(
+                content="There is no donation history to rebuild the balances from."
+            )
+        balances = self.journal.balances(context.guild.id)
+        bank_names = self.journal.banks(context.guild.id) & set(
+            await self.get_bank_index(context.guild)
+        )
+        changes = 0
+        for bank_name in bank_names:
+            current = self.ledger.donators(context.guild.id, bank_name)
+            rebuilt = balances.get(bank_name, {})
+            changes += sum(
+                current.get(k, 0) != rebuilt.get(k, 0)
+                for k in set(current) | set(rebuilt)
+            )
+        if not changes:
+            return await context.send(
+                content="The donation balances already match the donation history."
+            )
+        act = "This guild's donation balances have been rebuilt from the donation history."
+        conf = (
+            f"This will change **{cf.humanize_number(changes)}** donation balances on "
+            f"{cf.humanize_list([f'**{b.title()}**' for b in sorted(bank_names)])} to match "
+            "the donation history. Are you sure?"
+        )
+        view = nu.NoobConfirmation()
+        await view.start(context, act, content=conf)
+        await view.wait()
+        if view.value:
+            balances = self.journal.balances(context.guild.id)
+            for bank_name in bank_names:
+                await self.ledger.import_bank(
+                    context.guild.id,
+                    bank_name,
+                    {str(k): v for k, v in balances.get(bank_name, {}).items()},
+                )
 
     @donationloggerset.command(name="autorole")
     async def donationloggerset_autorole(self, context: commands.Context):
@@ -842,6 +1300,7 @@ class DonationLogger(commands.Cog):
         """
         current = await self.config.guild(context.guild).auto_role()
         await self.config.guild(context.guild).auto_role.set(not current)
+        self.invalidate_settings(context.guild.id)
         status = "will no longer" if current else "will now"
         await context.send(content=f"I {status} automatically add or remove roles.")
 
@@ -1033,12 +1492,14 @@ class DonationLogger(commands.Cog):
     @app_commands.describe(
         bank_name="The name of the registered bank.",
         top="The top number. (min: 1, max: 25, default: 10)",
+        window="Rank the donations of the last day, week or month. (default: all)",
     )
     async def slash_donationlogger_leaderboard(
         self,
         interaction: discord.Interaction[Red],
         bank_name: app_commands.Transform[str, BankConverter],
         top: app_commands.Range[int, 1, 25] = 10,
+        window: Literal["all", "daily", "weekly", "monthly"] = "all",
     ):
         """_summary_
 
@@ -1046,6 +1507,7 @@ class DonationLogger(commands.Cog):
             interaction (discord.Interaction[Red]): _description_
             bank_name (app_commands.Transform[str, BankConverter]): _description_
             top (app_commands.Range[int, 1, 25]): _description_
+            window (Literal["all", "daily", "weekly", "monthly"]): _description_
         """
         if isinstance(bank_name, list):
             if bank_name[1]:
@@ -1054,7 +1516,7 @@ class DonationLogger(commands.Cog):
                 )
             else:
                 return await interaction.response.send_message(content=bank_name[0])
-        await HYBRIDS.hybrid_leaderboard(self, interaction, bank_name, top)
+        await HYBRIDS.hybrid_leaderboard(self, interaction, bank_name, top, window)
 
     @slash_donologger.command(
         name="add", description="Add bank donation amount to a member or yourself."
@@ -1108,6 +1570,52 @@ class DonationLogger(commands.Cog):
                 return await interaction.response.send_message(content=amount[0])
         await HYBRIDS.hybrid_add(self, interaction, bank_name, amount, member, note)
 
+    @slash_donologger.command(
+        name="bulkadd", description="Add bank donations to many members at once."
+    )
+    @app_commands.describe(
+        bank_name="The name of the registered bank.",
+        entries="Member and amount pairs separated by semicolons. (example: @member 10m; 123456789 5m)",
+        file="A CSV file with one member,amount pair per row.",
+        note="Add an optional note as to why you added these donations.",
+    )
+    async def slash_donationlogger_bulkadd(
+        self,
+        interaction: discord.Interaction[Red],
+        bank_name: app_commands.Transform[str, BankConverter],
+        entries: Optional[str],
+        file: Optional[discord.Attachment],
+        note: Optional[str],
+    ):
+        """_summary_
+
+        Args:
+            interaction (discord.Interaction[Red]): _description_
+            bank_name (app_commands.Transform[str, BankConverter]): _description_
+            entries (Optional[str]): _description_
+            file (Optional[discord.Attachment]): _description_
+            note (Optional[str]): _description_
+        """
+        if not entries and not file:
+            return await interaction.response.send_message(
+                content="You need to pass either entries or a CSV file.", ephemeral=True
+            )
+        if note and len(note) > 1024:
+            return await interaction.response.send_message(
+                content="Limit your note into 1024 characters due to embed field limits."
+            )
+        if isinstance(bank_name, list):
+            if bank_name[1]:
+                return await interaction.response.send_message(
+                    content=bank_name[0], ephemeral=True
+                )
+            else:
+                return await interaction.response.send_message(content=bank_name[0])
+        csv_file = await file.read() if file else None
+        await HYBRIDS.hybrid_bulkadd(
+            self, interaction, bank_name, entries, csv_file, note
+        )
+
     @slash_donologger.command(
         name="remove",
         description="Remove bank donation amount to a member or yourself.",
@@ -6,13 +6,15 @@ import random
 from redbot.core.bot import commands, Red
 from redbot.core.utils import chat_formatting as cf, mod
 
-from typing import Literal, TYPE_CHECKING, Union
+from typing import Dict, List, Literal, TYPE_CHECKING, Union
 
 from .checks import (
     check_if_is_a_dono_manager_or_higher,
     check_if_setup_done,
     has_dono_permissions,
 )
+from .journal import LEADERBOARD_WINDOWS
+from .utilities import verify_bulk_entries
 from .views import DonationLoggerSetupView, TotalDonoView
 
 if TYPE_CHECKING:
@@ -66,7 +68,7 @@ class HYBRIDS:
                     content="You need to be a guild admin or a guild manager + to run this command.",
                     ephemeral=True,
                 )
-        if await cog.config.guild(obj.guild).setup():
+        if (await cog.get_guild_settings(obj.guild))["setup"]:
             content = (
                 "It appears this guild is already set up, "
                 "you can run this command again when you reset this guild."
@@ -109,7 +111,7 @@ class HYBRIDS:
                     content='I require the "Embed Links" permission to run this command.',
                     ephemeral=True,
                 )
-            if not check_if_setup_done(obj):
+            if not await check_if_setup_done(obj):
                 return await cls.hybrid_send(
                     obj,
                     content="DonationLogger has not been setup in this guild yet.",
@@ -121,6 +123,7 @@ class HYBRIDS:
                     content="You need to be a donationlogger manager or higher to run this command.",
                     ephemeral=True,
                 )
+        actor = obj.author.id if isinstance(obj, commands.Context) else obj.user.id
         if not bank_name:
             act = f"Successfully cleared all bank donations from **{member.name}**."
             conf = f"Are you sure you want to erase all bank donations from **{member.name}**?"
@@ -128,10 +131,12 @@ class HYBRIDS:
             await view.start(obj, act, content=conf)
             await view.wait()
             if view.value:
-                async with cog.config.guild(obj.guild).banks() as banks:
-                    for bank in banks.values():
-                        bank["donators"].setdefault(str(member.id), 0)
-                        bank["donators"][str(member.id)] = 0
+                balances = cog.get_member_balances(obj.guild, member)
+                await cog.ledger.clear_member(obj.guild.id, member.id)
+                for bank, donations in balances.items():
+                    cog.journal.record(
+                        obj.guild.id, "reset", bank, member.id, actor, -donations, 0
+                    )
             return
         act = f"Successfully cleared **{bank_name.title()}** donations from **{member.name}**."
         conf = f"Are you sure you want to clear **{bank_name.title()}** donations from **{member.name}**"
@@ -139,15 +144,21 @@ class HYBRIDS:
         await view.start(obj, act, content=conf)
         await view.wait()
         if view.value:
-            async with cog.config.guild(obj.guild).banks() as banks:
-                donations = banks[bank_name.lower()]["donators"].setdefault(
-                    str(member.id), 0
+            donations = cog.ledger.get(obj.guild.id, bank_name.lower(), member.id)
+            if donations == 0:
+                return await cls.hybrid_send(
+                    obj, content="This member has 0 donation balance for this bank."
                 )
-                if donations == 0:
-                    return await cls.hybrid_send(
-                        obj, content="This member has 0 donation balance for this bank."
-                    )
-                banks[bank_name.lower()]["donators"][str(member.id)] = 0
+            await cog.ledger.clear_member(obj.guild.id, member.id, bank_name.lower())
+            cog.journal.record(
+                obj.guild.id,
+                "reset",
+                bank_name.lower(),
+                member.id,
+                actor,
+                -donations,
+                0,
+            )
 
     @classmethod
     async def hybrid_balance(
@@ -167,26 +178,30 @@ class HYBRIDS:
                 ephemeral=True,
             )
         if bank_name:
-            async with cog.config.guild(obj.guild).banks() as banks:
-                bank = banks[bank_name.lower()]
-                donations = bank["donators"].setdefault(str(member.id), 0)
-                if bank["hidden"]:
-                    return await cls.hybrid_send(obj, content="This bank is hidden")
-                embed = discord.Embed(
-                    title=f"{member.name} ({member.id})",
-                    description=(
-                        f"Bank: {bank_name.title()}\n"
-                        f"Total amount donated: {bank['emoji']} {cf.humanize_number(donations)}"
-                    ),
-                    timestamp=discord.utils.utcnow(),
-                    colour=member.colour,
-                )
-                embed.set_thumbnail(url=nu.is_have_avatar(member))
-                embed.set_footer(
-                    text=f"{obj.guild.name} admires your donations!",
-                    icon_url=nu.is_have_avatar(obj.guild),
-                )
-                return await cls.hybrid_send(obj, embed=embed)
+            banks = await cog.config.guild(obj.guild).banks()
+            bank = banks[bank_name.lower()]
+            if bank["hidden"]:
+                return await cls.hybrid_send(obj, content="This bank is hidden")
+            donations = cog.ledger.get(obj.guild.id, bank_name.lower(), member.id)
+            rank = cog.ledger.ranking(obj.guild.id, bank_name.lower()).rank(
+                member.id, donations
+            )
+            embed = discord.Embed(
+                title=f"{member.name} ({member.id})",
+                description=(
+                    f"Bank: {bank_name.title()}\n"
+                    f"Total amount donated: {bank['emoji']} {cf.humanize_number(donations)}"
+                    + (f"\nLeaderboard rank: #{cf.humanize_number(rank)}" if rank else "")
+                ),
+                timestamp=discord.utils.utcnow(),
+                colour=member.colour,
+            )
+            embed.set_thumbnail(url=nu.is_have_avatar(member))
+            embed.set_footer(
+                text=f"{obj.guild.name} admires your donations!",
+                icon_url=nu.is_have_avatar(obj.guild),
+            )
+            return await cls.hybrid_send(obj, embed=embed)
         embed = await cog.get_all_bank_member_dono(obj.guild, member)
         await cls.hybrid_send(obj, embed=embed)
 
@@ -227,15 +242,9 @@ class HYBRIDS:
         if bank_data.get("hidden"):
             return await cls.hybrid_send(obj, content="This bank is hidden.")
 
-        donators = bank_data.get("donators", {})
-        filtered_donators = {
-            k: v
-            for k, v in donators.items()
-            if (mla == "more" and v >= amount) or (mla == "less" and v < amount)
-        }
-
-        sorted_donators = sorted(
-            filtered_donators.items(), key=lambda u: u[1], reverse=(mla == "more")
+        ranking = cog.ledger.ranking(obj.guild.id, bank_name.lower())
+        sorted_donators = (
+            ranking.at_least(amount) if mla == "more" else ranking.below(amount)
         )
 
         output_list = []
@@ -278,6 +287,7 @@ class HYBRIDS:
         obj: Union[commands.Context, discord.Interaction[Red]],
         bank_name: str,
         top: int,
+        window: str = "all",
     ):
         if (
             isinstance(obj, discord.Interaction)
@@ -291,21 +301,32 @@ class HYBRIDS:
         banks = await cog.config.guild(obj.guild).banks()
         if banks[bank_name.lower()]["hidden"]:
             return await cls.hybrid_send(obj, content="This bank is hidden.")
-        donors = banks[bank_name.lower()]["donators"]
         emoji = banks[bank_name.lower()]["emoji"]
-        sorted_donors = dict(sorted(donors.items(), key=lambda m: m[1], reverse=True))
+        if window == "all":
+            sorted_donors = cog.ledger.ranking(obj.guild.id, bank_name.lower()).top(top)
+            title = f"Top {top} donators for [{bank_name.title()}]"
+        else:
+            days = LEADERBOARD_WINDOWS[window]
+            sorted_donors = cog.journal.top_window(
+                obj.guild.id, bank_name.lower(), days, top
+            )
+            title = f"Top {top} {window} donators for [{bank_name.title()}]"
         embed = discord.Embed(
-            title=f"Top {top} donators for [{bank_name.title()}]",
+            title=title,
             colour=random.randint(0, 0xFFFFFF),
             timestamp=discord.utils.utcnow(),
         )
         embed.set_footer(text=obj.guild.name)
         embed.set_thumbnail(url=nu.is_have_avatar(obj.guild))
         if not sorted_donors:
-            embed.description = "It seems no one has donated from this bank yet."
-        for index, (k, v) in enumerate(sorted_donors.items(), 1):
-            if index > top:
-                break
+            embed.description = (
+                "It seems no one has donated from this bank yet."
+                if window == "all"
+                else "It seems no one has donated from this bank today."
+                if days == 1
+                else f"It seems no one has donated from this bank in the last {days} days."
+            )
+        for index, (k, v) in enumerate(sorted_donors, 1):
             member = obj.guild.get_member(int(k))
             mem = f"{member.name}" if member else f"[Member not found in guild] ({k})"
             embed.add_field(
@@ -332,7 +353,7 @@ class HYBRIDS:
                     content='I require the "Embed Links" permission to run this command.',
                     ephemeral=True,
                 )
-            if not check_if_setup_done(obj):
+            if not await check_if_setup_done(obj):
                 return await cls.hybrid_send(
                     obj,
                     content="DonationLogger has not been setup in this guild yet.",
@@ -348,60 +369,69 @@ class HYBRIDS:
             ctx = obj
         else:
             ctx = await obj.client.get_context(obj)
-        async with cog.config.guild(obj.guild).banks() as banks:
-            bank = banks[bank_name.lower()]
-            emoji = bank["emoji"]
-            if bank["hidden"]:
-                return await cls.hybrid_send(obj, content="This bank is hidden.")
-            multi = bank.get("multi")
-            if multi:
-                amount = round(amount * multi)
-            if amount > 999999999999999:
-                return await cls.hybrid_send(
-                    obj,
-                    ephemeral=True,
-                    content="The amount you provided is way too high, consider adding something reasonable."
-                )
-            bank["donators"].setdefault(str(member.id), 0)
-            bank["donators"][str(member.id)] += amount
-            updated = bank["donators"][str(member.id)]
-            previous = updated - amount
-            donated = cf.humanize_number(amount)
-            total = cf.humanize_number(updated)
-            roles = await cog.update_dono_roles(
-                ctx, "add", updated, member, bank["roles"]
-            )
-            humanized_roles = cf.humanize_list([role.mention for role in roles])
-            rep = (
-                f"{emoji} **{donated}** was added to **{member.name}**'s **__{bank_name.title()}__** "
-                f"donation balance.\nTheir total donation balance is now **{emoji} {total}** on "
-                f"**__{bank_name.title()}__**."
-            )
-            embed = discord.Embed(
-                title="Successfully Added",
-                description=rep,
-                colour=member.colour,
-                timestamp=discord.utils.utcnow()
+        banks = await cog.config.guild(obj.guild).banks()
+        bank = banks[bank_name.lower()]
+        emoji = bank["emoji"]
+        if bank["hidden"]:
+            return await cls.hybrid_send(obj, content="This bank is hidden.")
+        multi = bank.get("multi")
+        if multi:
+            amount = round(amount * multi)
+        if amount > 999999999999999:
+            return await cls.hybrid_send(
+                obj,
+                ephemeral=True,
+                content="The amount you provided is way too high, consider adding something reasonable."
             )
-            if multi:
-                embed.set_footer(text=f"Donation Multiplier: x{multi}")
-            if humanized_roles:
-                embed.add_field(
-                    name="Added Donation Roles:", value=humanized_roles, inline=False
-                )
-            await TotalDonoView(cog).start(ctx, member, content=member.mention, embed=embed)
-            await cog.send_to_log_channel(
-                ctx,
-                "add",
-                bank_name,
-                emoji,
-                amount,
-                previous,
-                updated,
-                member,
-                humanized_roles,
-                note,
+        previous, updated = await cog.ledger.add(
+            obj.guild.id, bank_name.lower(), member.id, amount
+        )
+        cog.journal.record(
+            obj.guild.id,
+            "add",
+            bank_name.lower(),
+            member.id,
+            ctx.author.id,
+            updated - previous,
+            updated,
+            note,
+        )
+        donated = cf.humanize_number(amount)
+        total = cf.humanize_number(updated)
+        roles = await cog.update_dono_roles(
+            ctx, "add", updated, member, bank_name.lower()
+        )
+        humanized_roles = cf.humanize_list([role.mention for role in roles])
+        rep = (
+            f"{emoji} **{donated}** was added to **{member.name}**'s **__{bank_name.title()}__** "
+            f"donation balance.\nTheir total donation balance is now **{emoji} {total}** on "
+            f"**__{bank_name.title()}__**."
+        )
+        embed = discord.Embed(
+            title="Successfully Added",
+            description=rep,
+            colour=member.colour,
+            timestamp=discord.utils.utcnow()
+        )
+        if multi:
+            embed.set_footer(text=f"Donation Multiplier: x{multi}")
+        if humanized_roles:
+            embed.add_field(
+                name="Added Donation Roles:", value=humanized_roles, inline=False
             )
+        await TotalDonoView(cog).start(ctx, member, content=member.mention, embed=embed)
+        await cog.send_to_log_channel(
+            ctx,
+            "add",
+            bank_name,
+            emoji,
+            amount,
+            previous,
+            updated,
+            member,
+            humanized_roles,
+            note,
+        )
 
     @classmethod
     async def hybrid_remove(
@@ -420,7 +450,7 @@ class HYBRIDS:
                     content='I require the "Embed Links" permission to run this command.',
                     ephemeral=True,
                 )
-            if not check_if_setup_done(obj):
+            if not await check_if_setup_done(obj):
                 return await cls.hybrid_send(
                     obj,
                     content="DonationLogger has not been setup in this guild yet.",
@@ -436,56 +466,60 @@ class HYBRIDS:
             ctx: commands.Context = obj
         else:
             ctx: commands.Context = await obj.client.get_context(obj)
-        async with cog.config.guild(obj.guild).banks() as banks:
-            bank = banks[bank_name.lower()]
-            donators = bank["donators"]
-            emoji = bank["emoji"]
-            member_id = str(member.id)
-            if bank["hidden"]:
-                return await cls.hybrid_send(obj, content="This bank is hidden.")
-            donators.setdefault(member_id, 0)
-            if donators[member_id] == 0:
-                return await cls.hybrid_send(
-                    obj, content="This member has 0 donation balance for this bank."
-                )
-            donators[member_id] -= amount
-            updated1 = donators[member_id]
-            if updated1 < 0:
-                donators[member_id] = 0
-            updated2 = donators[member_id]
-            previous = updated1 + amount
-            donated = cf.humanize_number(amount)
-            total = cf.humanize_number(updated2)
-            roles = await cog.update_dono_roles(
-                ctx, "remove", updated2, member, bank["roles"]
-            )
-            humanized_roles = cf.humanize_list([role.mention for role in roles])
-            rep = (
-                f"{emoji} **{donated}** was removed from **{member.name}**'s **__{bank_name.title()}__** "
-                f"donation balance.\nTheir total donation balance is now **{emoji} {total}** on "
-                f"**__{bank_name.title()}__**."
-            )
-            embed = discord.Embed(
-                title="Successfully Removed",
-                description=rep,
-                colour=member.colour,
-                timestamp=discord.utils.utcnow()
-            )
-            if humanized_roles:
-                embed.add_field(name="Removed Donation Roles:", value=humanized_roles, inline=False)
-            await TotalDonoView(cog).start(ctx, member, content=member.mention, embed=embed)
-            await cog.send_to_log_channel(
-                ctx,
-                "remove",
-                bank_name,
-                emoji,
-                amount,
-                previous,
-                updated2,
-                member,
-                humanized_roles,
-                note,
+        banks = await cog.config.guild(obj.guild).banks()
+        bank = banks[bank_name.lower()]
+        emoji = bank["emoji"]
+        if bank["hidden"]:
+            return await cls.hybrid_send(obj, content="This bank is hidden.")
+        if cog.ledger.get(obj.guild.id, bank_name.lower(), member.id) == 0:
+            return await cls.hybrid_send(
+                obj, content="This member has 0 donation balance for this bank."
             )
+        previous, updated2 = await cog.ledger.add(
+            obj.guild.id, bank_name.lower(), member.id, -amount
+        )
+        cog.journal.record(
+            obj.guild.id,
+            "remove",
+            bank_name.lower(),
+            member.id,
+            ctx.author.id,
+            updated2 - previous,
+            updated2,
+            note,
+        )
+        donated = cf.humanize_number(amount)
+        total = cf.humanize_number(updated2)
+        roles = await cog.update_dono_roles(
+            ctx, "remove", updated2, member, bank_name.lower()
+        )
+        humanized_roles = cf.humanize_list([role.mention for role in roles])
+        rep = (
+            f"{emoji} **{donated}** was removed from **{member.name}**'s **__{bank_name.title()}__** "
+            f"donation balance.\nTheir total donation balance is now **{emoji} {total}** on "
+            f"**__{bank_name.title()}__**."
+        )
+        embed = discord.Embed(
+            title="Successfully Removed",
+            description=rep,
+            colour=member.colour,
+            timestamp=discord.utils.utcnow()
+        )
+        if humanized_roles:
+            embed.add_field(name="Removed Donation Roles:", value=humanized_roles, inline=False)
+        await TotalDonoView(cog).start(ctx, member, content=member.mention, embed=embed)
+        await cog.send_to_log_channel(
+            ctx,
+            "remove",
+            bank_name,
+            emoji,
+            amount,
+            previous,
+            updated2,
+            member,
+            humanized_roles,
+            note,
+        )
 
     @classmethod
     async def hybrid_set(
@@ -503,7 +537,7 @@ class HYBRIDS:
                     content='I require the "Embed Links" permission to run this command.',
                     ephemeral=True,
                 )
-            if not check_if_setup_done(obj):
+            if not await check_if_setup_done(obj):
                 return await cls.hybrid_send(
                     obj,
                     content="DonationLogger has not been setup in this guild yet.",
@@ -519,46 +553,168 @@ class HYBRIDS:
             ctx: commands.Context = obj
         else:
             ctx: commands.Context = await obj.client.get_context(obj)
-        async with cog.config.guild(obj.guild).banks() as banks:
-            bank = banks[bank_name.lower()]
-            donators = bank["donators"]
-            emoji = bank["emoji"]
-            if bank["hidden"]:
-                return await cls.hybrid_send(obj, content="This bank is hidden.")
-            donators.setdefault(str(member.id), 0)
-            previous = donators[str(member.id)]
-            donators[str(member.id)] = amount
-            aroles = await cog.update_dono_roles(
-                ctx, "add", amount, member, bank["roles"]
+        banks = await cog.config.guild(obj.guild).banks()
+        bank = banks[bank_name.lower()]
+        emoji = bank["emoji"]
+        if bank["hidden"]:
+            return await cls.hybrid_send(obj, content="This bank is hidden.")
+        previous = await cog.ledger.set(
+            obj.guild.id, bank_name.lower(), member.id, amount
+        )
+        cog.journal.record(
+            obj.guild.id,
+            "set",
+            bank_name.lower(),
+            member.id,
+            ctx.author.id,
+            amount - previous,
+            amount,
+        )
+        aroles = await cog.update_dono_roles(
+            ctx, "add", amount, member, bank_name.lower()
+        )
+        rrole = await cog.update_dono_roles(
+            ctx, "remove", amount, member, bank_name.lower()
+        )
+        roles = aroles + rrole
+        humanized_roles = cf.humanize_list([role.mention for role in roles])
+        rep = (
+            f"{emoji} **{cf.humanize_number(amount)}** was set as **{member.name}**'s "
+            f"**__{bank_name.title()}__** donation balance."
+        )
+        embed = discord.Embed(
+            title="Successfully Set",
+            description=rep,
+            colour=member.colour,
+            timestamp=discord.utils.utcnow()
+        )
+        if humanized_roles:
+            embed.add_field(
+                name="Added/Removed Donation Roles:", value=humanized_roles, inline=False
+            )
+        await TotalDonoView(cog).start(ctx, member, content=member.mention, embed=embed)
+        await cog.send_to_log_channel(
+            ctx,
+            "set",
+            bank_name,
+            emoji,
+            amount,
+            previous,
+            amount,
+            member,
+            humanized_roles,
+        )
+
+    @classmethod
+    async def hybrid_bulkadd(
+        cls,
+        cog: "DonationLogger",
+        obj: Union[commands.Context, discord.Interaction[Red]],
+        bank_name: str,
+        entries: str = None,
+        csv_file: bytes = None,
+        note: str = None,
+    ):
+        if isinstance(obj, discord.Interaction):
+            if not obj.channel.permissions_for(obj.guild.me).embed_links:
+                return await cls.hybrid_send(
+                    obj,
+                    content='I require the "Embed Links" permission to run this command.',
+                    ephemeral=True,
+                )
+            if not await check_if_setup_done(obj):
+                return await cls.hybrid_send(
+                    obj,
+                    content="DonationLogger has not been setup in this guild yet.",
+                    ephemeral=True,
+                )
+            if not await check_if_is_a_dono_manager_or_higher(obj):
+                return await cls.hybrid_send(
+                    obj,
+                    content="You need to be a donationlogger manager or higher to run this command.",
+                    ephemeral=True,
+                )
+            await obj.response.defer()
+        if isinstance(obj, commands.Context):
+            ctx: commands.Context = obj
+        else:
+            ctx: commands.Context = await obj.client.get_context(obj)
+        banks = await cog.config.guild(obj.guild).banks()
+        bank = banks[bank_name.lower()]
+        emoji = bank["emoji"]
+        if bank["hidden"]:
+            return await cls.hybrid_send(obj, content="This bank is hidden.")
+        parsed, failed = await verify_bulk_entries(ctx, entries, csv_file)
+        if failed:
+            return await cls.hybrid_send(
+                obj,
+                content="Nothing was added, I could not parse these entries:\n"
+                + cf.box("\n".join(failed)[:1800]),
+                allowed_mentions=discord.AllowedMentions.none(),
             )
-            rrole = await cog.update_dono_roles(
-                ctx, "remove", amount, member, bank["roles"]
+        if not parsed:
+            return await cls.hybrid_send(
+                obj, content="I could not find any valid `member amount` pairs."
             )
-            roles = aroles + rrole
-            humanized_roles = cf.humanize_list([role.mention for role in roles])
-            rep = (
-                f"{emoji} **{cf.humanize_number(amount)}** was set as **{member.name}**'s "
-                f"**__{bank_name.title()}__** donation balance."
+        if len(parsed) > 200:
+            return await cls.hybrid_send(
+                obj, content="You can only add donations to up to 200 members at once."
             )
-            embed = discord.Embed(
-                title="Successfully Set",
-                description=rep,
-                colour=member.colour,
-                timestamp=discord.utils.utcnow()
+        multi = bank.get("multi")
+        if multi:
+            parsed = {k: round(v * multi) for k, v in parsed.items()}
+        if too_high := [k for k, v in parsed.items() if v > 999999999999999]:
+            return await cls.hybrid_send(
+                obj,
+                content="The amount you provided for "
+                f"{cf.humanize_list([m.mention for m in too_high])} is way too high, "
+                "consider adding something reasonable.",
+                allowed_mentions=discord.AllowedMentions.none(),
             )
-            if humanized_roles:
-                embed.add_field(
-                    name="Added/Removed Donation Roles:", value=humanized_roles, inline=False
-                )
-            await TotalDonoView(cog).start(ctx, member, content=member.mention, embed=embed)
-            await cog.send_to_log_channel(
-                ctx,
-                "set",
-                bank_name,
-                emoji,
-                amount,
-                previous,
-                amount,
-                member,
-                humanized_roles,
+
+        results: List[Dict[str, Union[discord.Member, int]]] = []
+        for member, amount in parsed.items():
+            previous, updated = await cog.ledger.add(
+                obj.guild.id, bank_name.lower(), member.id, amount
             )
+            cog.journal.record(
+                obj.guild.id,
+                "add",
+                bank_name.lower(),
+                member.id,
+                ctx.author.id,
+                updated - previous,
+                updated,
+                note,
+            )
+            results.append(
+                {"member": member, "amount": amount, "previous": previous, "updated": updated}
+            )
+
+        roles = await cog.bulk_update_dono_roles(
+            ctx,
+            "add",
+            {r["member"]: r["updated"] for r in results},
+            bank_name.lower(),
+        )
+        total = sum(r["amount"] for r in results)
+        desc = (
+            f"{emoji} **{cf.humanize_number(total)}** was added to **{len(results)}** members' "
+            f"**__{bank_name.title()}__** donation balance."
+        )
+        embed = discord.Embed(
+            title="Successfully Bulk Added",
+            description=desc,
+            colour=await ctx.embed_colour(),
+            timestamp=discord.utils.utcnow(),
+        )
+        if multi:
+            embed.set_footer(text=f"Donation Multiplier: x{multi}")
+        if roles:
+            embed.add_field(
+                name="Members Given Donation Roles:",
+                value=cf.humanize_number(len(roles)),
+                inline=False,
+            )
+        await cls.hybrid_send(obj, embed=embed)
+        await cog.send_bulk_to_log_channel(ctx, bank_name, emoji, results, roles, note)
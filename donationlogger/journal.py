@@ -0,0 +1,308 @@
+import asyncio
+import heapq
+import json
+import logging
+import os
+import time
+
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+# [timestamp, action, bank_name, member_id, actor_id, delta, balance, note]
+JournalRow = List
+
+LEADERBOARD_WINDOWS = {"daily": 1, "weekly": 7, "monthly": 30}
+
+# Only these actions are donations, set and reset rows are balance corrections.
+DONATION_ACTIONS = ("add", "remove")
+
+log = logging.getLogger("red.NoobCogs.DonationLogger")
+
+
+def window_start(days: int) -> int:
+    """
+    Get the start of a window of the last few days (UTC), today counting as the first day.
+    """
+    return (int(time.time()) // 86400 - days + 1) * 86400
+
+
+class DonationJournal:
+    """
+    Append-only history of every donation balance change.
+
+    Each guild has its own JSON lines file with one compact row per change:
+    ``[timestamp, action, bank_name, member_id, actor_id, delta, balance, note]``.
+    Rows are kept in memory in timestamp order, so time-window lookups are a bisect.
+
+    Once a guild goes over `max_rows` the oldest rows are folded into
+    ``checkpoint`` rows holding the balances they led to, so balances can
+    always be rebuilt from the journal.
+
+    Net donations (add and remove rows) are also summed into per-day buckets for
+    each bank, so windowed leaderboards merge at most `bucket_days` buckets
+    instead of scanning rows.
+    """
+
+    max_rows = 100000
+    max_note_length = 200
+    bucket_days = 31
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.rows: Dict[int, List[JournalRow]] = {}
+        self.timestamps: Dict[int, List[int]] = {}
+        self.limits: Dict[int, int] = {}
+        self.pending: Dict[int, List[JournalRow]] = {}
+        self.rewrite: Set[int] = set()
+        # {guild_id: {bank_name: {day: {member_id: net_amount}}}}
+        self.buckets: Dict[int, Dict[str, Dict[int, Dict[int, int]]]] = {}
+
+    async def initialize(self):
+        self.rows, damaged = await asyncio.to_thread(self._read_all)
+        self.timestamps = {k: [r[0] for r in v] for k, v in self.rows.items()}
+        self.buckets.clear()
+        for guild_id in self.rows:
+            self._rebuild_buckets(guild_id)
+        self.limits.clear()
+        self.pending.clear()
+        # Damaged files are rewritten with only their valid rows on the next flush.
+        self.rewrite = damaged
+
+    def _read_all(self) -> Tuple[Dict[int, List[JournalRow]], Set[int]]:
+        self.path.mkdir(parents=True, exist_ok=True)
+        rows = {}
+        damaged = set()
+        for file in self.path.glob("*.jsonl"):
+            guild_rows = rows[int(file.stem)] = []
+            with file.open(encoding="utf-8", errors="replace") as f:
+                for number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        row = json.loads(line)
+                    except json.JSONDecodeError:
+                        row = None
+                    if not isinstance(row, list) or len(row) != 8:
+                        log.warning(
+                            f"Skipped a damaged row on line {number} of journal {file.name}."
+                        )
+                        damaged.add(int(file.stem))
+                        continue
+                    guild_rows.append(row)
+        return rows, damaged
+
+    def _write(
+        self,
+        rewrite: Dict[int, List[JournalRow]],
+        pending: Dict[int, List[JournalRow]],
+    ):
+        self.path.mkdir(parents=True, exist_ok=True)
+        for guild_id, rows in rewrite.items():
+            file = self.path / f"{guild_id}.jsonl"
+            if not rows:
+                file.unlink(missing_ok=True)
+                continue
+            temp = file.with_suffix(".tmp")
+            with temp.open("w", encoding="utf-8") as f:
+                f.writelines(json.dumps(r, separators=(",", ":")) + "\n" for r in rows)
+                f.flush()
+                os.fsync(f.fileno())
+            temp.replace(file)
+        for guild_id, rows in pending.items():
+            if guild_id in rewrite:
+                continue
+            with (self.path / f"{guild_id}.jsonl").open("a", encoding="utf-8") as f:
+                f.writelines(json.dumps(r, separators=(",", ":")) + "\n" for r in rows)
+                f.flush()
+                os.fsync(f.fileno())
+
+    async def flush(self):
+        """
+        Append new rows to, or rewrite, the journal files that changed.
+        """
+        if not self.rewrite and not self.pending:
+            return
+        rewrite = {k: list(self.rows.get(k, [])) for k in self.rewrite}
+        pending, self.pending, self.rewrite = self.pending, {}, set()
+        try:
+            await asyncio.to_thread(self._write, rewrite, pending)
+        except Exception:
+            self.rewrite |= set(rewrite.keys())
+            for guild_id, rows in pending.items():
+                self.pending[guild_id] = rows + self.pending.get(guild_id, [])
+            raise
+
+    def has_guild(self, guild_id: int) -> bool:
+        return bool(self.rows.get(guild_id))
+
+    def record(
+        self,
+        guild_id: int,
+        action: str,
+        bank_name: str,
+        member_id: int,
+        actor_id: Optional[int],
+        delta: int,
+        balance: int,
+        note: str = None,
+    ):
+        row = [
+            int(time.time()),
+            action,
+            bank_name,
+            member_id,
+            actor_id,
+            delta,
+            balance,
+            note[: self.max_note_length] if note else None,
+        ]
+        self.rows.setdefault(guild_id, []).append(row)
+        self.timestamps.setdefault(guild_id, []).append(row[0])
+        self.pending.setdefault(guild_id, []).append(row)
+        self._bucket(guild_id, row)
+        if len(self.rows[guild_id]) > self.limits.get(
+            guild_id, self.max_rows + self.max_rows // 10
+        ):
+            self._compact(guild_id)
+
+    def seed(self, guild_id: int, balances: Dict[str, Dict[int, int]]):
+        """
+        Start a guild's journal with checkpoints of its current balances.
+        """
+        now = int(time.time())
+        rows = [
+            [now, "checkpoint", bank_name, member_id, None, 0, amount, None]
+            for bank_name, donators in balances.items()
+            for member_id, amount in donators.items()
+        ]
+        if not rows:
+            return
+        self.rows.setdefault(guild_id, []).extend(rows)
+        self.timestamps.setdefault(guild_id, []).extend(r[0] for r in rows)
+        self.pending.setdefault(guild_id, []).extend(rows)
+
+    def _compact(self, guild_id: int):
+        rows = self.rows[guild_id]
+        cut = len(rows) - self.max_rows
+        dropped, kept = rows[:cut], rows[cut:]
+        kept_keys = {(r[2], r[3]) for r in kept}
+        last: Dict[Tuple[str, int], JournalRow] = {}
+        for r in dropped:
+            last[(r[2], r[3])] = r
+        checkpoints = [
+            [r[0], "checkpoint", r[2], r[3], None, 0, r[6], None]
+            for k, r in last.items()
+            if k not in kept_keys
+        ]
+        checkpoints.sort(key=lambda r: r[0])
+        self.rows[guild_id] = checkpoints + kept
+        self.timestamps[guild_id] = [r[0] for r in self.rows[guild_id]]
+        # Donors that only have checkpoints left can outnumber max_rows,
+        # so the next compaction waits for another max_rows // 10 rows.
+        self.limits[guild_id] = (
+            max(len(self.rows[guild_id]), self.max_rows) + self.max_rows // 10
+        )
+        self.pending.pop(guild_id, None)
+        self.rewrite.add(guild_id)
+
+    def _bucket(self, guild_id: int, row: JournalRow):
+        if row[1] not in DONATION_ACTIONS or not row[5]:
+            return
+        day = row[0] // 86400
+        days = self.buckets.setdefault(guild_id, {}).setdefault(row[2], {})
+        if day not in days:
+            for expired in [d for d in days if d <= day - self.bucket_days]:
+                del days[expired]
+        bucket = days.setdefault(day, {})
+        bucket[row[3]] = bucket.get(row[3], 0) + row[5]
+
+    def _rebuild_buckets(self, guild_id: int):
+        self.buckets.pop(guild_id, None)
+        since = window_start(self.bucket_days)
+        for r in self.since(guild_id, since):
+            self._bucket(guild_id, r)
+
+    def _filter(self, guild_id: int, keep):
+        if guild_id not in self.rows:
+            return
+        self.rows[guild_id] = [r for r in self.rows[guild_id] if keep(r)]
+        self.timestamps[guild_id] = [r[0] for r in self.rows[guild_id]]
+        self._rebuild_buckets(guild_id)
+        self.pending.pop(guild_id, None)
+        self.rewrite.add(guild_id)
+
+    def clear_bank(self, guild_id: int, bank_name: str):
+        self._filter(guild_id, lambda r: r[2] != bank_name)
+
+    def clear_guild(self, guild_id: int):
+        self._filter(guild_id, lambda r: False)
+
+    def clear_all(self):
+        for guild_id in list(self.rows.keys()):
+            self.clear_guild(guild_id)
+
+    def clear_user(self, user_id: int):
+        for guild_id, rows in self.rows.items():
+            if any(user_id in (r[3], r[4]) for r in rows):
+                self._filter(guild_id, lambda r: r[3] != user_id)
+                for r in self.rows[guild_id]:
+                    if r[4] == user_id:
+                        r[4] = None
+
+    def since(self, guild_id: int, timestamp: int) -> List[JournalRow]:
+        """
+        Get every row of a guild from the timestamp onwards.
+        """
+        index = bisect_left(self.timestamps.get(guild_id, []), timestamp)
+        return self.rows.get(guild_id, [])[index:]
+
+    def totals_since(
+        self, guild_id: int, bank_name: str, timestamp: int
+    ) -> Dict[int, int]:
+        """
+        Get each member's net donations on a bank from the timestamp onwards.
+
+        Balances changed with set or reset are not donations and are left out.
+        """
+        totals: Dict[int, int] = {}
+        for r in self.since(guild_id, timestamp):
+            if r[2] == bank_name and r[1] in DONATION_ACTIONS:
+                totals[r[3]] = totals.get(r[3], 0) + r[5]
+        return totals
+
+    def top_window(
+        self, guild_id: int, bank_name: str, days: int, count: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Get the top donors of a bank over the last few days (UTC), highest first.
+
+        Today counts as the first day of the window.
+        """
+        today = int(time.time()) // 86400
+        totals: Dict[int, int] = {}
+        for day, bucket in self.buckets.get(guild_id, {}).get(bank_name, {}).items():
+            if day > today - days:
+                for k, v in bucket.items():
+                    totals[k] = totals.get(k, 0) + v
+        return heapq.nlargest(
+            count, ((k, v) for k, v in totals.items() if v > 0), key=lambda x: x[1]
+        )
+
+    def banks(self, guild_id: int) -> Set[str]:
+        """
+        Get the names of the banks of a guild that have journal rows.
+        """
+        return {r[2] for r in self.rows.get(guild_id, [])}
+
+    def balances(self, guild_id: int) -> Dict[str, Dict[int, int]]:
+        """
+        Rebuild every balance of a guild by replaying its journal.
+        """
+        balances: Dict[str, Dict[int, int]] = {}
+        for r in self.rows.get(guild_id, []):
+            balances.setdefault(r[2], {})[r[3]] = r[6]
+        return {
+            bank_name: {k: v for k, v in donators.items() if v}
+            for bank_name, donators in balances.items()
+        }
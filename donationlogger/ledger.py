@@ -0,0 +1,219 @@
+from redbot.core.bot import Config
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class BankRanking:
+    """
+    The donors of a bank kept sorted by amount, highest first.
+
+    Entries are ``(-amount, member_id)`` tuples so ties are ordered by member ID.
+    """
+
+    def __init__(self, donators: Dict[int, int]):
+        self.entries: List[Tuple[int, int]] = sorted(
+            (-amount, member_id) for member_id, amount in donators.items()
+        )
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def update(self, member_id: int, previous: Optional[int], amount: Optional[int]):
+        if previous is not None:
+            index = bisect_left(self.entries, (-previous, member_id))
+            if index < len(self.entries) and self.entries[index][1] == member_id:
+                del self.entries[index]
+        if amount is not None:
+            insort(self.entries, (-amount, member_id))
+
+    def top(self, count: Optional[int] = None) -> List[Tuple[int, int]]:
+        """
+        Get the top donors as ``(member_id, amount)`` pairs, highest first.
+        """
+        return [(k, -v) for v, k in self.entries[:count]]
+
+    def rank(self, member_id: int, amount: int) -> Optional[int]:
+        index = bisect_left(self.entries, (-amount, member_id))
+        if index < len(self.entries) and self.entries[index][1] == member_id:
+            return index + 1
+
+    def at_least(self, amount: int) -> List[Tuple[int, int]]:
+        """
+        Get the donors with at least this amount, highest first.
+        """
+        index = bisect_right(self.entries, (-amount, float("inf")))
+        return [(k, -v) for v, k in self.entries[:index]]
+
+    def below(self, amount: int) -> List[Tuple[int, int]]:
+        """
+        Get the donors with less than this amount, lowest first.
+        """
+        index = bisect_right(self.entries, (-amount, float("inf")))
+        return [(k, -v) for v, k in reversed(self.entries[index:])]
+
+
+class DonationLedger:
+    """
+    Per-donor balance storage.
+
+    Every (guild, bank, donor) balance is its own record in the ``DONATIONS``
+    custom config group. Reads are served from an in-memory index that mirrors
+    the group, and each bank gets a `BankRanking` built on first use.
+
+    Balance changes only touch memory and mark the donor dirty, `flush` then
+    writes the dirty records, so a burst of donations costs one write per donor.
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.cache: Dict[int, Dict[str, Dict[int, int]]] = {}
+        self.rankings: Dict[int, Dict[str, BankRanking]] = {}
+        self.dirty: Set[Tuple[int, str, int]] = set()
+
+    async def initialize(self):
+        self.dirty.clear()
+        self.rankings.clear()
+        self.cache = {
+            int(guild_id): {
+                bank_name: {int(k): v.get("amount", 0) for k, v in donators.items()}
+                for bank_name, donators in guild_data.items()
+            }
+            for guild_id, guild_data in (
+                await self.config.custom("DONATIONS").all()
+            ).items()
+        }
+
+    def _record(self, guild_id: int, bank_name: str, member_id: int):
+        return self.config.custom(
+            "DONATIONS", str(guild_id), bank_name, str(member_id)
+        )
+
+    def get(self, guild_id: int, bank_name: str, member_id: int) -> int:
+        return self.cache.get(guild_id, {}).get(bank_name, {}).get(member_id, 0)
+
+    def donators(self, guild_id: int, bank_name: str) -> Dict[int, int]:
+        """
+        Get every donor of a bank as a ``{member_id: amount}`` dict.
+        """
+        return self.cache.get(guild_id, {}).get(bank_name, {}).copy()
+
+    def ranking(self, guild_id: int, bank_name: str) -> BankRanking:
+        rankings = self.rankings.setdefault(guild_id, {})
+        if bank_name not in rankings:
+            rankings[bank_name] = BankRanking(self.donators(guild_id, bank_name))
+        return rankings[bank_name]
+
+    def _update_ranking(
+        self,
+        guild_id: int,
+        bank_name: str,
+        member_id: int,
+        previous: Optional[int],
+        amount: Optional[int],
+    ):
+        ranking = self.rankings.get(guild_id, {}).get(bank_name)
+        if ranking is not None:
+            ranking.update(member_id, previous, amount)
+
+    def member_balances(self, guild_id: int, member_id: int) -> Dict[str, int]:
+        """
+        Get a member's balance on every bank they have a record in.
+        """
+        return {
+            bank_name: donators[member_id]
+            for bank_name, donators in self.cache.get(guild_id, {}).items()
+            if member_id in donators
+        }
+
+    async def set(
+        self, guild_id: int, bank_name: str, member_id: int, amount: int
+    ) -> int:
+        """
+        Set a donor's balance and return the previous one.
+        """
+        bank = self.cache.setdefault(guild_id, {}).setdefault(bank_name, {})
+        previous = bank.get(member_id)
+        bank[member_id] = amount
+        self._update_ranking(guild_id, bank_name, member_id, previous, amount)
+        self.dirty.add((guild_id, bank_name, member_id))
+        return previous or 0
+
+    async def add(
+        self, guild_id: int, bank_name: str, member_id: int, amount: int
+    ) -> Tuple[int, int]:
+        """
+        Add to a donor's balance without going below 0.
+
+        Nothing is written if the balance does not change, e.g. removing from a non-donor.
+        Returns the previous and the updated balance.
+        """
+        previous = self.get(guild_id, bank_name, member_id)
+        updated = max(previous + amount, 0)
+        if updated != previous:
+            await self.set(guild_id, bank_name, member_id, updated)
+        return previous, updated
+
+    async def import_bank(
+        self, guild_id: int, bank_name: str, donators: Dict[str, int]
+    ):
+        self.cache.setdefault(guild_id, {})[bank_name] = {
+            int(k): v for k, v in donators.items() if v
+        }
+        self.rankings.get(guild_id, {}).pop(bank_name, None)
+        await self.config.custom("DONATIONS", str(guild_id), bank_name).set(
+            {k: {"amount": v} for k, v in donators.items() if v}
+        )
+
+    async def clear_member(
+        self, guild_id: int, member_id: int, bank_name: Optional[str] = None
+    ):
+        guild_data = self.cache.get(guild_id, {})
+        for bank in [bank_name] if bank_name else list(guild_data.keys()):
+            previous = guild_data.get(bank, {}).pop(member_id, None)
+            if previous is not None:
+                self._update_ranking(guild_id, bank, member_id, previous, None)
+                self.dirty.add((guild_id, bank, member_id))
+
+    async def clear_bank(self, guild_id: int, bank_name: str):
+        self.cache.get(guild_id, {}).pop(bank_name, None)
+        self.rankings.get(guild_id, {}).pop(bank_name, None)
+        self.dirty = {k for k in self.dirty if k[:2] != (guild_id, bank_name)}
+        await self.config.custom("DONATIONS", str(guild_id), bank_name).clear()
+
+    async def clear_guild(self, guild_id: int):
+        self.cache.pop(guild_id, None)
+        self.rankings.pop(guild_id, None)
+        self.dirty = {k for k in self.dirty if k[0] != guild_id}
+        await self.config.custom("DONATIONS", str(guild_id)).clear()
+
+    async def clear_user(self, member_id: int):
+        for guild_id in list(self.cache.keys()):
+            await self.clear_member(guild_id, member_id)
+
+    async def clear_all(self):
+        self.cache.clear()
+        self.rankings.clear()
+        self.dirty.clear()
+        await self.config.clear_all_custom("DONATIONS")
+
+    async def flush(self):
+        """
+        Write every dirty balance to config.
+
+        Records that could not be written stay dirty for the next flush.
+        """
+        dirty, self.dirty = self.dirty, set()
+        pending = list(dirty)
+        try:
+            while pending:
+                guild_id, bank_name, member_id = pending[-1]
+                record = self._record(guild_id, bank_name, member_id)
+                amount = self.cache.get(guild_id, {}).get(bank_name, {}).get(member_id)
+                if amount is None:
+                    await record.clear()
+                else:
+                    await record.amount.set(amount)
+                pending.pop()
+        finally:
+            self.dirty.update(pending)
@@ -1,9 +1,13 @@
+import csv
 import discord
+import io
 import noobutils as nu
+import re
 
 from redbot.core.bot import commands
 
-from typing import Dict, List, Union
+from bisect import bisect_right
+from typing import Dict, List, Set, Tuple, Union
 
 from .converters import AmountConverter, DLEmojiConverter
 from .exceptions import (
@@ -12,6 +16,32 @@ from .exceptions import (
 )
 
 
+class AmountRoleTable:
+    """
+    A bank's amount roles compiled into sorted thresholds.
+
+    `reached[i]` holds the role IDs of the first `i` thresholds and
+    `unreached[i]` the role IDs of threshold `i` onwards.
+    """
+
+    def __init__(self, roles: Dict[str, List[int]]):
+        items = sorted((int(k), set(v)) for k, v in roles.items())
+        self.thresholds: List[int] = [k for k, _ in items]
+        self.reached: List[Set[int]] = [set()]
+        for _, role_ids in items:
+            self.reached.append(self.reached[-1] | role_ids)
+        self.unreached: List[Set[int]] = [set()]
+        for _, role_ids in reversed(items):
+            self.unreached.append(self.unreached[-1] | role_ids)
+        self.unreached.reverse()
+
+    def to_add(self, amount: int, member_roles: Set[int]) -> Set[int]:
+        return self.reached[bisect_right(self.thresholds, amount)] - member_roles
+
+    def to_remove(self, amount: int, member_roles: Set[int]) -> Set[int]:
+        return self.unreached[bisect_right(self.thresholds, amount)] & member_roles
+
+
 async def verify_channel(
     context: commands.Context, argument: str
 ) -> discord.TextChannel:
@@ -72,3 +102,49 @@ async def verify_amount_roles(
             except AmountConversionFailure:
                 continue
     return dict(sorted(par.items(), key=lambda b: int(b[0])))
+
+
+async def verify_bulk_entries(
+    context: commands.Context, raw_entries: str = None, csv_file: bytes = None
+) -> Tuple[Dict[discord.Member, int], List[str]]:
+    """
+    Parse `member amount` pairs from text and/or `member,amount` rows from a CSV file.
+
+    Text entries are separated by new lines or semicolons, so amounts can keep their
+    thousands separators. Amounts for the same member are summed.
+    Returns the parsed pairs and the entries that failed.
+    """
+    raw_pairs: List[Tuple[str, str]] = []
+    if raw_entries:
+        for chunk in re.split(r"[;\n]", raw_entries):
+            if chunk := chunk.strip():
+                raw_pairs.append(tuple(chunk.rsplit(None, 1)))
+    if csv_file:
+        rows = csv.reader(io.StringIO(csv_file.decode("utf-8", "replace")))
+        for index, row in enumerate(rows):
+            if cells := [cell.strip() for cell in row if cell.strip()]:
+                # Skip a header row such as `member,amount`.
+                if index == 0 and not any(c.isdigit() for c in "".join(cells[1:])):
+                    continue
+                # Unquoted amounts with thousands separators span several cells.
+                raw_pairs.append(
+                    (cells[0], "".join(cells[1:])) if len(cells) > 2 else tuple(cells)
+                )
+
+    entries: Dict[discord.Member, int] = {}
+    failed: List[str] = []
+    for pair in raw_pairs:
+        if len(pair) != 2:
+            failed.append(" ".join(pair))
+            continue
+        try:
+            member = await commands.MemberConverter().convert(context, pair[0])
+            amount = await AmountConverter.convert(context, pair[1])
+        except commands.BadArgument:
+            failed.append(" ".join(pair))
+            continue
+        if member.bot:
+            failed.append(" ".join(pair))
+            continue
+        entries[member] = entries.get(member, 0) + amount
+    return entries, failed
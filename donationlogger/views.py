@@ -317,7 +317,6 @@ class DonationLoggerSetupView(discord.ui.View):
                     "hidden": False,
                     "emoji": str(self.bank["emoji"]),
                     "roles": {},
-                    "donators": {},
                 }
             }
         async with config(interaction.guild).managers() as managers:
@@ -333,7 +332,12 @@ class DonationLoggerSetupView(discord.ui.View):
                 banks[self.bank["name"].lower()]["roles"] |= {
                     k: [r.id for r in v] for k, v in self.amount_roles.items()
                 }
+            self.cog.invalidate_amount_roles(
+                interaction.guild.id, self.bank["name"].lower()
+            )
         await config(interaction.guild).setup.set(True)
+        self.cog.invalidate_settings(interaction.guild.id)
+        self.cog.invalidate_bank_index(interaction.guild.id)
         for x in self.children:
             x.disabled = True
         await self.message.edit(view=self)
@@ -388,37 +392,9 @@ class TotalDonoView(discord.ui.View):
     async def total_dono(
         self, interaction: discord.Interaction[Red], button: discord.ui.Button
     ):
-        final = {}
-        final_overall = []
-        async with self.cog.config.guild(interaction.guild).banks() as banks:
-            for k, v in banks.items():
-                if v["hidden"]:
-                    continue
-                donations = v["donators"].setdefault(str(self.member.id), 0)
-                final[k] = f"{v['emoji']} {cf.humanize_number(donations)}"
-                final_overall.append(donations)
-
-        overall = sum(final_overall)
-        embed = discord.Embed(
-            description=f"Overall combined bank donation amount: {cf.humanize_number(overall)}",
-            timestamp=discord.utils.utcnow(),
-            colour=self.member.colour,
-        )
-        embed.set_author(
-            name=f"{self.member} ({self.member.id})",
-            icon_url=nu.is_have_avatar(self.member),
+        embed = await self.cog.get_all_bank_member_dono(
+            interaction.guild, self.member
         )
-        embed.set_footer(
-            text=f"{interaction.guild.name} admires your donations!",
-            icon_url=nu.is_have_avatar(interaction.guild),
-        )
-        if final:
-            for k, v in final.items():
-                embed.add_field(name=k.title(), value=v, inline=True)
-        else:
-            embed.description = (
-                "There are no banks registered yet, or banks are hidden."
-            )
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
     async def on_timeout(self):
@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 import datetime as dt
 import discord
@@ -9,9 +10,10 @@ from redbot.core.bot import commands, Config, Red
 from redbot.core.utils import chat_formatting as cf, mod
 
 from discord.ext import tasks
-from typing import Any, Dict, List, Literal, Optional, TYPE_CHECKING, Union
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple, TYPE_CHECKING, Union
 
 from .converters import AmountConverter
+from .scheduler import DueScheduler, TimerWheel
 
 if TYPE_CHECKING:
     from donationlogger.donationlogger import DonationLogger
@@ -42,6 +44,7 @@ class GrinderLogger(commands.Cog):
             "tiers": {"1": {}, "2": {}, "3": {}, "4": {}, "5": {}},
             "dm_status": True,
             "bank": None,
+            "warnings": [],
         }
         default_member = {
             "donations": 0,
@@ -54,8 +57,17 @@ class GrinderLogger(commands.Cog):
         self.log = logging.getLogger("red.NoobCogs.GrinderLogger")
         self.init_done = False
         self.data: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.grinder_guilds: Dict[str, Set[str]] = {}
+        self.scheduler = DueScheduler()
+        self.warning_wheel = TimerWheel(time.time())
+        self.warning_hours: Dict[str, List[int]] = {}
+        self.dirty: Set[Tuple[str, str]] = set()
+        self.settings_cache: Dict[int, Dict[str, Any]] = {}
 
-    __version__ = "1.1.15"
+    payment_history_size = 20
+    reminder_batch_window = 60
+
+    __version__ = "1.2.0"
     __author__ = ["NoobInDaHause"]
     __docs__ = (
         "https://github.com/NoobInDaHause/NoobCogs/blob/red-3.5/grinderlogger/README.md"
@@ -80,17 +92,12 @@ class GrinderLogger(commands.Cog):
         """
         This cog stores user ID for grinder logs. Users can remove their data at anytime.
         """
-        for guild_id, grinder_data in self.data.copy().items():
-            if grinder_data:
-                for member_id in grinder_data.keys():
-                    if user_id == int(member_id):
-                        if self.data.get(guild_id, {}).get(member_id):
-                            self.data[guild_id].pop(member_id)
-                        await self.config.member_from_ids(
-                            int(guild_id), int(member_id)
-                        ).clear()
+        member_id = str(user_id)
+        for guild_id in self.get_grinder_guilds(user_id):
+            self.remove_from_data(guild_id, member_id)
+            await self.config.member_from_ids(int(guild_id), user_id).clear()
 
-        await self.back_to_config()
+        await self.flush_data()
 
     async def cog_load(self):
         self.bot.add_dev_env_value("grinderlogger", lambda _: self)
@@ -104,9 +111,22 @@ class GrinderLogger(commands.Cog):
             self.log.info(
                 f"GrinderLogger data initialized in {round(after_time - before_time, 3)}s."
             )
+        self.scheduler.clear()
+        self.grinder_guilds.clear()
+        self.warning_wheel = TimerWheel(time.time())
+        self.warning_hours = {
+            str(k): v["warnings"]
+            for k, v in (await self.config.all_guilds()).items()
+            if v["warnings"]
+        }
+        for guild_id, grinder_data in self.data.items():
+            for member_id in grinder_data.keys():
+                self.grinder_guilds.setdefault(member_id, set()).add(guild_id)
+                self.reschedule(guild_id, member_id)
 
         self.init_done = True
         self.due_reminder_loop.start()
+        self.due_warning_loop.start()
         self.save_data_to_config.start()
         self.log.info("Due reminder loop task and Save data to config task started.")
 
@@ -114,36 +134,161 @@ class GrinderLogger(commands.Cog):
         self.bot.remove_dev_env_value("grinderlogger")
         self.init_done = False
         self.due_reminder_loop.cancel()
+        self.due_warning_loop.cancel()
         self.save_data_to_config.cancel()
-        await self.back_to_config()
+        await self.flush_data()
         self.log.info("Due reminder loop task and Save data to config task cancelled.")
 
-    async def back_to_config(self):
-        old_data = (await self.config.custom("Grinders").all()).copy()
-        old_data.update(self.data)
-        await self.config.custom("Grinders").set(old_data)
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self.invalidate_settings(role.guild.id)
+
+    async def get_guild_settings(self, guild: discord.Guild) -> Dict[str, Any]:
+        """
+        Get a guild's GrinderLogger settings, cached until they are changed.
+
+        Also holds the resolved manager roles and the role of each set tier.
+        """
+        if guild.id not in self.settings_cache:
+            settings = await self.config.guild(guild).all()
+            settings["manager_roles"] = [
+                role for r in settings["managers"] if (role := guild.get_role(r))
+            ]
+            settings["tier_roles"] = {
+                k: role
+                for k, v in settings["tiers"].items()
+                if v and (role := guild.get_role(v["role"]))
+            }
+            self.settings_cache[guild.id] = settings
+        return self.settings_cache[guild.id]
+
+    def invalidate_settings(self, guild_id: int = None):
+        if guild_id is None:
+            self.settings_cache.clear()
+        else:
+            self.settings_cache.pop(guild_id, None)
+
+    def mark_dirty(self, guild_id: str, member_id: str):
+        """
+        Queue a grinder's data to be written on the next flush.
+        """
+        self.dirty.add((guild_id, member_id))
+
+    async def flush_data(self):
+        """
+        Write only the grinders that changed since the last flush to config.
+
+        Grinders that could not be written stay dirty for the next flush.
+        """
+        dirty, self.dirty = self.dirty, set()
+        pending = list(dirty)
+        try:
+            while pending:
+                guild_id, member_id = pending[-1]
+                group = self.config.custom("Grinders", guild_id)
+                if member_data := self.data.get(guild_id, {}).get(member_id):
+                    await group.set_raw(member_id, value=member_data)
+                else:
+                    await group.clear_raw(member_id)
+                pending.pop()
+        finally:
+            self.dirty.update(pending)
+
+    async def save_guild_data(self, guild_id: str):
+        """
+        Save every grinder of a guild to config in a single write.
+        """
+        pending = {k for k in self.dirty if k[0] == guild_id}
+        self.dirty -= pending
+        try:
+            await self.config.custom("Grinders", guild_id).set(
+                dict(self.data.get(guild_id, {}))
+            )
+        except Exception:
+            self.dirty |= pending
+            raise
+
+    async def increment_times_as_grinder(
+        self, guild: discord.Guild, members: List[discord.Member]
+    ):
+        """
+        Bump the times as grinder count of many members.
+
+        Each member's counter is its own write, so other member settings are never overwritten.
+        """
+        for member in members:
+            times = self.config.member_from_ids(guild.id, member.id).times_as_grinder
+            await times.set(await times() + 1)
 
     def add_to_data(self, guild_id: str, member_id: str, member_data: dict):
         self.data.setdefault(guild_id, {})
         self.data[guild_id].update({member_id: member_data})
+        self.grinder_guilds.setdefault(member_id, set()).add(guild_id)
+        self.mark_dirty(guild_id, member_id)
 
     def remove_from_data(self, guild_id: str, member_id: str):
         with contextlib.suppress(KeyError):
             self.data[guild_id].pop(member_id)
+        self.unindex_grinder(guild_id, member_id)
+        self.reschedule(guild_id, member_id)
+        self.mark_dirty(guild_id, member_id)
+
+    def unindex_grinder(self, guild_id: str, member_id: str):
+        if guilds := self.grinder_guilds.get(member_id):
+            guilds.discard(guild_id)
+            if not guilds:
+                del self.grinder_guilds[member_id]
+
+    def get_grinder_guilds(self, user_id: int) -> List[str]:
+        """
+        Get the IDs of every guild the user is a grinder in.
+        """
+        return list(self.grinder_guilds.get(str(user_id), ()))
+
+    def record_payment(
+        self, member_data: Dict[str, Any], amount: int, due_timestamp: Optional[int]
+    ):
+        """
+        Keep the last `payment_history_size` payments of a grinder.
+
+        Each payment is a ``[paid_timestamp, delay_seconds, amount]`` list, where the delay
+        is how long after the due date it was paid (negative if early, None if no due date).
+        """
+        paid = member_data["last_payed"]
+        delay = paid - due_timestamp if due_timestamp else None
+        payments = member_data.setdefault("payments", [])
+        payments.append([paid, delay, amount])
+        del payments[: -self.payment_history_size]
+
+    def reschedule(self, guild_id: str, member_id: str):
+        """
+        Sync a grinder's due reminder and due soon warnings with its data.
+        """
+        member_data = self.data.get(guild_id, {}).get(member_id)
+        self.warning_wheel.cancel((guild_id, member_id))
+        if member_data and member_data["due_timestamp"] and not member_data["reminded"]:
+            due = member_data["due_timestamp"]
+            self.scheduler.schedule(guild_id, member_id, due)
+            now = time.time()
+            for hours in self.warning_hours.get(guild_id, []):
+                if due - hours * 3600 > now:
+                    self.warning_wheel.schedule(
+                        (guild_id, member_id), hours, due - hours * 3600
+                    )
+        else:
+            self.scheduler.unschedule(guild_id, member_id)
 
     async def add_or_remove_grinder_roles(
-        self, _type: str, member: discord.Member, roles: list, reason: str
+        self, _type: str, member: discord.Member, roles: List[discord.Role], reason: str
     ) -> List[discord.Role]:
         if isinstance(member, discord.User):
             return []
         action = member.add_roles if _type == "add" else member.remove_roles
         hybrid_roles = [
-            role
-            for x in roles
-            if (role := member.guild.get_role(x))
-            and (role in member.roles) == (_type == "remove")
+            role for role in roles if (role.id in member._roles) == (_type == "remove")
         ]
-        await action(*hybrid_roles, reason=reason)
+        if hybrid_roles:
+            await action(*hybrid_roles, reason=reason)
         return hybrid_roles
 
     async def dm_grinder(
@@ -202,83 +347,157 @@ class GrinderLogger(commands.Cog):
         ):
             await member.send(embed=embed)
 
-    async def remind_member(self, guild: discord.Guild, member_id: str):
-        tiers = await self.config.guild(guild).tiers()
-        managers = await self.config.guild(guild).managers()
-        channels = await self.config.guild(guild).channels()
-        mem = guild.get_member(int(member_id))
-        if mem:
-            c = mem.colour
-            av = nu.is_have_avatar(mem)
-        else:
-            c = self.bot._color
-            av = None
-        member_data = self.data[str(guild.id)][member_id]
-        member_data["reminded"] = True
-        await self.back_to_config()
-        tier = member_data.get("tier")
-        man_roles: List[discord.Role] = []
-        for rid in managers:
-            if role := guild.get_role(rid):
-                man_roles.append(role)
-        try:
-            at = f"**{tier}** ({cf.humanize_number(tiers[tier]['amount'])}/day)"
-        except KeyError:
-            at = "It seems this tier is not defined please report this to the admins."
+    async def remind_members(self, guild: discord.Guild, member_ids: List[str]):
+        """
+        Remind every due grinder of a guild and notify the managers once.
+
+        DMs are sent concurrently, at most 5 at a time.
+        """
+        settings = await self.get_guild_settings(guild)
+        tiers = settings["tiers"]
+        channels = settings["channels"]
+        man_roles: List[discord.Role] = settings["manager_roles"]
+        guild_data = self.data.get(str(guild.id), {})
+        # Grinders can be removed while reminders are sent, so only their tiers are kept.
+        member_tiers: Dict[str, Optional[str]] = {}
+        for member_id in member_ids:
+            if member_data := guild_data.get(member_id):
+                member_data["reminded"] = True
+                member_tiers[member_id] = member_data.get("tier")
+                self.mark_dirty(str(guild.id), member_id)
+        member_ids = list(member_tiers.keys())
+        if not member_ids:
+            return
         ada = round(dt.datetime.now(dt.timezone.utc).timestamp())
         ad = f"<t:{ada}:R> (<t:{ada}:D>)"
 
-        dms_off = []
-        try:
+        def tier_text(member_id: str) -> str:
+            tier = member_tiers[member_id]
+            try:
+                return f"**{tier}** ({cf.humanize_number(tiers[tier]['amount'])}/day)"
+            except KeyError:
+                return "It seems this tier is not defined please report this to the admins."
+
+        semaphore = asyncio.Semaphore(5)
+
+        async def dm(member_id: str) -> bool:
+            mem = guild.get_member(int(member_id))
+            if not mem:
+                return False
             grindembed = discord.Embed(
                 description=(
                     "# 🔔 Grinder Payment Reminder 🔔\n"
                     "- Just a friendly reminder that today is the **due date** for your grinder payment.\n"
                     "- Please ensure your payment is made promptly to maintain your grinder status in "
-                    f"**{guild.name}**.\n\n__**Details**__\n- `{'Tier':<4}`: {at}\n"
+                    f"**{guild.name}**.\n\n__**Details**__\n- `{'Tier':<4}`: {tier_text(member_id)}\n"
                     f"- `{'Date':<4}`: {ad}\n\n"
                     "⚠️ `Note`: Feel free to pay early!"
                 ),
                 timestamp=dt.datetime.now(dt.timezone.utc),
-                colour=c,
+                colour=mem.colour,
             )
             grindembed.set_thumbnail(url=nu.is_have_avatar(guild))
             grindembed.set_footer(text=guild.name, icon_url=nu.is_have_avatar(guild))
-            await mem.send(embed=grindembed)
-        except (discord.errors.Forbidden, discord.errors.HTTPException, AttributeError):
-            dms_off.append(True)
+            async with semaphore:
+                try:
+                    await mem.send(embed=grindembed)
+                except (discord.errors.Forbidden, discord.errors.HTTPException):
+                    return False
+            return True
+
+        dmed = await asyncio.gather(*(dm(member_id) for member_id in member_ids))
         if not channels["notifying"]:
             return
         notifchan = self.bot.get_channel(channels["notifying"])
-        with contextlib.suppress(
-            (discord.errors.Forbidden, discord.errors.HTTPException)
-        ):
-            warn = (
-                "⚠️ Warning: I could not DM this member they might have DM's closed."
-                if dms_off
-                else ""
-            )
+        if not notifchan:
+            return
+        lines = [
+            f"- <@{member_id}> (`{member_id}`): {tier_text(member_id)}"
+            + ("" if ok else " ⚠️ DM's closed")
+            for member_id, ok in zip(member_ids, dmed)
+        ]
+        warn = (
+            "\n⚠️ Warning: I could not DM some of these members they might have DM's closed."
+            if not all(dmed)
+            else ""
+        )
+        pages = list(cf.pagify("\n".join(lines), page_length=3000))
+        if len(member_ids) == 1:
+            mem = guild.get_member(int(member_ids[0]))
+            c = mem.colour if mem else self.bot._color
+            av = nu.is_have_avatar(mem) if mem else None
+        else:
+            c = self.bot._color
+            av = nu.is_have_avatar(guild)
+        for index, page in enumerate(pages):
             adminembed = discord.Embed(
                 colour=c,
                 description=(
                     "# 🔔 Grinder Manager Reminder 🔔\nHey **Grinder Managers.**\n\n"
-                    f"Notifying you that: <@{member_id}> (`{member_id}`) is due for payment.\n"
+                    f"Notifying you that these grinders are due for payment ({ad}):\n{page}\n\n"
                     "- Please verify their payment status, **update** the grinder log, "
-                    "and ensure their status remains intact.\n\n__**Payment Details**__\n"
-                    f"- `{'Member':<6}`: <@{member_id}>\n- `{'Tier':<6}`: {at}\n"
-                    f"- `{'Date':<6}`: {ad}\n\nThanks for your attention!\n{warn}"
+                    f"and ensure their status remains intact.\n\nThanks for your attention!{warn}"
                 ),
                 timestamp=dt.datetime.now(dt.timezone.utc),
             )
-            adminembed.set_footer(text=guild.name, icon_url=nu.is_have_avatar(guild))
+            adminembed.set_footer(
+                text=f"{guild.name} | Page ({index + 1}/{len(pages)})"
+                if len(pages) > 1
+                else guild.name,
+                icon_url=nu.is_have_avatar(guild),
+            )
             adminembed.set_thumbnail(url=av)
-            with contextlib.suppress(discord.errors.Forbidden):
+            with contextlib.suppress(
+                (discord.errors.Forbidden, discord.errors.HTTPException)
+            ):
                 await notifchan.send(
                     content=cf.humanize_list([role.mention for role in man_roles]),
                     embed=adminembed,
                     allowed_mentions=discord.AllowedMentions(roles=man_roles),
                 )
 
+    async def warn_members(
+        self, guild: discord.Guild, warnings: List[Tuple[str, int]]
+    ):
+        """
+        DM grinders that their payment is due soon, at most 5 at a time.
+        """
+        tiers = (await self.get_guild_settings(guild))["tiers"]
+        guild_data = self.data.get(str(guild.id), {})
+        semaphore = asyncio.Semaphore(5)
+
+        async def warn(member_id: str, hours: int):
+            mem = guild.get_member(int(member_id))
+            member_data = guild_data.get(member_id)
+            if not mem or not member_data:
+                return
+            due = member_data["due_timestamp"]
+            tier = member_data["tier"]
+            try:
+                at = f"**{tier}** ({cf.humanize_number(tiers[tier]['amount'])}/day)"
+            except KeyError:
+                at = "It seems this tier is not defined please report this to the admins."
+            embed = discord.Embed(
+                description=(
+                    "# ⏰ Grinder Payment Due Soon ⏰\n"
+                    f"- Your grinder payment in **{guild.name}** is due in about "
+                    f"**{cf.humanize_timedelta(seconds=hours * 3600)}**.\n\n__**Details**__\n"
+                    f"- `{'Tier':<4}`: {at}\n- `{'Date':<4}`: <t:{due}:R> (<t:{due}:F>)\n\n"
+                    "⚠️ `Note`: Feel free to pay early!"
+                ),
+                timestamp=dt.datetime.now(dt.timezone.utc),
+                colour=mem.colour,
+            )
+            embed.set_thumbnail(url=nu.is_have_avatar(guild))
+            embed.set_footer(text=guild.name, icon_url=nu.is_have_avatar(guild))
+            async with semaphore:
+                with contextlib.suppress(
+                    (discord.errors.Forbidden, discord.errors.HTTPException)
+                ):
+                    await mem.send(embed=embed)
+
+        await asyncio.gather(*(warn(m, h) for m, h in warnings))
+
     async def log_grinder_history(
         self,
         context: commands.Context,
@@ -300,7 +519,7 @@ class GrinderLogger(commands.Cog):
             else ""
         )
         res = f"\n- `{'Reason':<11}`: {reason}" if reason else ""
-        chan = await self.config.guild(context.guild).channels.history()
+        chan = (await self.get_guild_settings(context.guild))["channels"]["history"]
         if not chan:
             return
         hchan = self.bot.get_channel(chan)
@@ -340,7 +559,7 @@ class GrinderLogger(commands.Cog):
         amount: int,
         reason: str = None,
     ):
-        chan = await self.config.guild(context.guild).channels.history()
+        chan = (await self.get_guild_settings(context.guild))["channels"]["history"]
         if not chan:
             return
         hchan = context.guild.get_channel(chan)
@@ -384,6 +603,71 @@ class GrinderLogger(commands.Cog):
                 embed=embed,
             )
 
+    async def log_bulk_grinder_history(
+        self,
+        context: commands.Context,
+        _type: Literal["added", "promote", "demote"],
+        members: List[discord.Member],
+        tier: str,
+        amount: int,
+        before_tiers: Dict[int, str] = None,
+        reason: str = None,
+    ):
+        chan = (await self.get_guild_settings(context.guild))["channels"]["history"]
+        if not chan:
+            return
+        hchan = context.guild.get_channel(chan)
+        dat = dt.datetime.now(dt.timezone.utc)
+        if _type == "added":
+            title = "__GRINDERS ADDED__"
+            desc = f"- {len(members)} new Grinders have joined the ranks. Welcome Aboard! 📥"
+            lines = [f"- {m.mention} (`{m.id}`)" for m in members]
+        else:
+            title = "__GRINDER PROMOTIONS__" if _type == "promote" else "__GRINDER DEMOTIONS__"
+            emo = "⬆️" if _type == "promote" else "⬇️"
+            desc = (
+                f"- {len(members)} grinders have been "
+                f"{'**upgraded**' if _type == 'promote' else '**demoted**'} to a new tier."
+            )
+            lines = [
+                f"- {m.mention} (`{m.id}`): **{before_tiers[m.id]}** ➜ **{tier}** {emo}"
+                for m in members
+            ]
+        res = f"\n- `{'Reason':<6}`: {reason}" if reason else ""
+        pages = list(cf.pagify("\n".join(lines), page_length=3000))
+        for index, page in enumerate(pages, 1):
+            embed = discord.Embed(
+                title=title,
+                description=f"{desc}\n\n__**Details:**__\n- `{'Tier':<6}`: **{tier}** "
+                f"({cf.humanize_number(amount)}/day)\n- `{'Date':<6}`: <t:{round(dat.timestamp())}:F>"
+                f"{res}\n\n__**Members:**__\n{page}",
+                colour=await context.embed_colour(),
+                timestamp=dat,
+            )
+            embed.set_footer(
+                text=f"Authorized by: {context.author} ({context.author.id})"
+                + (f" | Page ({index}/{len(pages)})" if len(pages) > 1 else ""),
+                icon_url=nu.is_have_avatar(context.author),
+            )
+            try:
+                await hchan.send(embed=embed)
+            except Exception:
+                await context.send(
+                    content="Grinder history channel not found please report this to the admins.",
+                    embed=embed,
+                )
+
+    @staticmethod
+    def get_tier_roles(settings: Dict[str, Any], low: int, high: int) -> List[discord.Role]:
+        """
+        Get the roles of the set tiers from low to high, inclusive.
+        """
+        return [
+            role
+            for n in range(low, high + 1)
+            if (role := settings["tier_roles"].get(str(n)))
+        ]
+
     async def dm_on_promote_or_demote(
         self,
         member: discord.Member,
@@ -440,7 +724,7 @@ class GrinderLogger(commands.Cog):
         due_time: int = None,
         note: str = None,
     ):
-        logchan = await self.config.guild(context.guild).channels.logging()
+        logchan = (await self.get_guild_settings(context.guild))["channels"]["logging"]
         if not logchan:
             return
         lchan = self.bot.get_channel(logchan)
@@ -486,6 +770,28 @@ class GrinderLogger(commands.Cog):
                 content="⚠️ Log channel not found.", embed=embed, view=view
             )
 
+    async def forward_to_donationlogger(
+        self,
+        context: commands.Context,
+        member: discord.Member,
+        bank: str,
+        amount: int,
+        note: str = None,
+    ):
+        """
+        Mirror a grinder donation onto the linked DonationLogger bank.
+        """
+        cog: "DonationLogger" = self.bot.get_cog("DonationLogger")
+        if not cog:
+            return
+        n = f"`From GrinderLogger`: {note}" if note else "From GrinderLogger."
+        try:
+            await cog.apply_donation(
+                context.guild, bank, member, amount, note=n, actor=context.author
+            )
+        except commands.BadArgument as e:
+            await context.send(content=f"Could not update DonationLogger: {e}")
+
     async def donoadd(
         self,
         context: commands.Context,
@@ -497,12 +803,13 @@ class GrinderLogger(commands.Cog):
         """
         Add donation and set due duration on a grinder.
         """
-        bank = await self.config.guild(context.guild).bank()
+        bank = (await self.get_guild_settings(context.guild))["bank"]
 
         if member.bot:
             return await context.send(content="Bots are not allowed.")
         if guild := self.data.get(str(context.guild.id), {}):
             if member_data := guild.get(str(member.id)):
+                due_before = member_data["due_timestamp"]
                 if due_duration:
                     dat = (
                         dt.datetime.fromtimestamp(
@@ -521,7 +828,9 @@ class GrinderLogger(commands.Cog):
                 member_data["last_payed"] = round(
                     dt.datetime.now(dt.timezone.utc).timestamp()
                 )
-                await self.back_to_config()
+                self.record_payment(member_data, amount, due_before)
+                self.reschedule(str(context.guild.id), str(member.id))
+                self.mark_dirty(str(context.guild.id), str(member.id))
                 await context.tick()
                 await self.send_to_log_channel(
                     context,
@@ -533,20 +842,10 @@ class GrinderLogger(commands.Cog):
                     member_data["due_timestamp"],
                     note,
                 )
-                if bank and context.bot.get_cog("DonationLogger"):
-                    if cmd := self.bot.get_command("donationlogger add"):
-                        n = (
-                            f"`From GrinderLogger`: {note}"
-                            if note
-                            else "From GrinderLogger."
-                        )
-                        await context.invoke(
-                            cmd,
-                            bank_name=bank,
-                            amount=amount,
-                            member=member,
-                            note=n,
-                        )
+                if bank:
+                    await self.forward_to_donationlogger(
+                        context, member, bank, amount, note
+                    )
             else:
                 await context.send(content="This member is not a grinder.")
         else:
@@ -565,7 +864,7 @@ class GrinderLogger(commands.Cog):
         """
         if member.bot:
             return await context.send(content="Bots are not allowed.")
-        bank = await self.config.guild(context.guild).bank()
+        bank = (await self.get_guild_settings(context.guild))["bank"]
         if guild := self.data.get(str(context.guild.id), {}):
             if member_data := guild.get(str(member.id)):
                 before = await self.config.member(member).donations()
@@ -583,9 +882,10 @@ class GrinderLogger(commands.Cog):
                         member_data["reminded"] = True
                     else:
                         member_data["due_timestamp"] = round(new_date.timestamp())
+                    self.reschedule(str(context.guild.id), str(member.id))
                 after = max(before - amount, 0)
                 await self.config.member(member).donations.set(after)
-                await self.back_to_config()
+                self.mark_dirty(str(context.guild.id), str(member.id))
                 await context.tick()
                 await self.send_to_log_channel(
                     context,
@@ -597,20 +897,10 @@ class GrinderLogger(commands.Cog):
                     member_data["due_timestamp"],
                     note,
                 )
-                if bank and context.bot.get_cog("DonationLogger"):
-                    if cmd := self.bot.get_command("donationlogger remove"):
-                        n = (
-                            f"`From GrinderLogger`: {note}"
-                            if note
-                            else "From GrinderLogger."
-                        )
-                        await context.invoke(
-                            cmd,
-                            bank_name=bank,
-                            amount=amount,
-                            member=member,
-                            note=n,
-                        )
+                if bank:
+                    await self.forward_to_donationlogger(
+                        context, member, bank, -amount, note
+                    )
             else:
                 await context.send(content="This member is not a grinder.")
         else:
@@ -622,28 +912,24 @@ class GrinderLogger(commands.Cog):
         sort_by: str,
         all_m: Dict[Union[discord.Member, int], Dict[str, Any]]
     ) -> List[str]:
-        tiers = await self.config.guild(guild).tiers()
+        tiers = (await self.get_guild_settings(guild))["tiers"]
+        tier_labels = {
+            k: f"{k} ({cf.humanize_number(v['amount'])}/day)" if v else k
+            for k, v in tiers.items()
+        }
         all_mem = []
         if sort_by == "dono":
             k = lambda x: x[1]["donations"]
         elif sort_by == "due":
-
-            def check(x):
-                d = x[1]["due"]
-                if d is None:
-                    d = 0
-                return d
-
-            k = check
+            k = lambda x: x[1]["due"] or 0
         else:
             k = lambda x: int(x[1]["tier"])
 
         for index, (mem, mem_dono) in enumerate(
             sorted(all_m.items(), key=k, reverse=True), 1
         ):
-            amt = tiers[mem_dono['tier']]["amount"]
+            t = tier_labels.get(mem_dono["tier"], mem_dono["tier"])
             if isinstance(mem, discord.Member):
-                t = f"{mem_dono['tier']} ({cf.humanize_number(amt)}/day)"
                 msg = (
                     f"` {index}. ` {mem.mention} (`{mem.id}`):\n"
                     f"> - `{f'Tier':<9}`: **{t}**\n"
@@ -660,32 +946,63 @@ class GrinderLogger(commands.Cog):
             all_mem.append(msg)
         return all_mem
 
-    @tasks.loop(seconds=5)
+    @tasks.loop(seconds=0)
     async def due_reminder_loop(self):
+        await self.scheduler.wait()
         if not self.init_done:
             return
-        for guild_id, grinder_data in self.data.copy().items():
-            if guild := self.bot.get_guild(int(guild_id)):
-                for member_id in grinder_data.keys():
-                    if member_data := self.data.get(guild_id, {}).get(member_id):
-                        if not member_data["reminded"] and member_data["due_timestamp"] and (
-                            dt.datetime.fromtimestamp(
-                                member_data["due_timestamp"], dt.timezone.utc
-                            )
-                            < dt.datetime.now(dt.timezone.utc)
-                        ):
-                            try:
-                                await self.remind_member(guild, member_id)
-                            except Exception as e:
-                                self.log.exception(str(e), exc_info=e)
-
-    @tasks.loop(minutes=5)
-    async def save_data_to_config(self):
+        now = time.time()
+        due: Dict[str, List[str]] = {}
+        # Grinders due shortly after the first one are reminded with it,
+        # so their managers get one notification instead of one each.
+        for guild_id, member_id in self.scheduler.pop_due(
+            now + self.reminder_batch_window
+        ):
+            member_data = self.data.get(guild_id, {}).get(member_id)
+            if not member_data or member_data["reminded"]:
+                continue
+            if not self.bot.get_guild(int(guild_id)):
+                # Guild is unavailable for now, try again in a minute.
+                self.scheduler.schedule(guild_id, member_id, round(now) + 60)
+                continue
+            due.setdefault(guild_id, []).append(member_id)
+        for guild_id, member_ids in due.items():
+            try:
+                await self.remind_members(self.bot.get_guild(int(guild_id)), member_ids)
+            except Exception as e:
+                self.log.exception(str(e), exc_info=e)
+
+    @tasks.loop(minutes=1)
+    async def due_warning_loop(self):
         if not self.init_done:
             return
-        await self.back_to_config()
+        warnings: Dict[str, Dict[str, int]] = {}
+        for (guild_id, member_id), hours in self.warning_wheel.advance(time.time()):
+            member_data = self.data.get(guild_id, {}).get(member_id)
+            if not member_data or member_data["reminded"]:
+                continue
+            # Only the closest warning of a grinder is sent if several fire at once.
+            member_warnings = warnings.setdefault(guild_id, {})
+            member_warnings[member_id] = min(hours, member_warnings.get(member_id, hours))
+        for guild_id, member_warnings in warnings.items():
+            if not (guild := self.bot.get_guild(int(guild_id))):
+                continue
+            try:
+                await self.warn_members(guild, list(member_warnings.items()))
+            except Exception as e:
+                self.log.exception(str(e), exc_info=e)
+
+    @tasks.loop(seconds=10)
+    async def save_data_to_config(self):
+        if not self.init_done or not self.dirty:
+            return
+        try:
+            await self.flush_data()
+        except Exception as e:
+            self.log.exception("Error saving grinder data to config.", exc_info=e)
 
     @due_reminder_loop.before_loop
+    @due_warning_loop.before_loop
     @save_data_to_config.before_loop
     async def tasks_before_loop(self):
         await self.bot.wait_until_red_ready()
@@ -704,7 +1021,7 @@ class GrinderLogger(commands.Cog):
                 or await mod.is_mod_or_superior(context.bot, context.author)
                 or any(
                     role_id in context.author._roles
-                    for role_id in await cog.config.guild(context.guild).managers()
+                    for role_id in (await cog.get_guild_settings(context.guild))["managers"]
                 )
                 or False
             )
@@ -741,7 +1058,8 @@ class GrinderLogger(commands.Cog):
             return await context.send(
                 content="Limit your damn reason to 2k characters."
             )
-        tiers = await self.config.guild(context.guild).tiers()
+        settings = await self.get_guild_settings(context.guild)
+        tiers = settings["tiers"]
 
         if not tiers[tier]:
             return await context.send(
@@ -762,15 +1080,11 @@ class GrinderLogger(commands.Cog):
                 before = member_data.get("tier")
                 member_data["tier"] = tier
                 after = member_data.get("tier")
-                await self.back_to_config()
+                self.mark_dirty(str(context.guild.id), str(member.id))
                 audit_reason = mod.get_audit_reason(
                     context.author, reason=f"Member promoted to a Tier {tier} grinder."
                 )
-                roles = []
-                for tier_number in range(int(tier)):
-                    tn = str(tier_number + 1)
-                    if tiers[tn]:
-                        roles.append(tiers[tn]["role"])
+                roles = self.get_tier_roles(settings, 1, int(tier))
                 added_roles = await self.add_or_remove_grinder_roles(
                     "add", member, roles, audit_reason
                 )
@@ -783,7 +1097,7 @@ class GrinderLogger(commands.Cog):
                     tiers[tier]["amount"],
                     reason,
                 )
-                if await self.config.guild(context.guild).dm_status():
+                if settings["dm_status"]:
                     await self.dm_on_promote_or_demote(
                         member,
                         "promote",
@@ -822,7 +1136,8 @@ class GrinderLogger(commands.Cog):
             return await context.send(
                 content="Limit your damn reason to 2k characters."
             )
-        tiers = await self.config.guild(context.guild).tiers()
+        settings = await self.get_guild_settings(context.guild)
+        tiers = settings["tiers"]
 
         if not tiers[tier]:
             return await context.send(
@@ -843,15 +1158,11 @@ class GrinderLogger(commands.Cog):
                 before = member_data.get("tier")
                 member_data["tier"] = tier
                 after = member_data.get("tier")
-                await self.back_to_config()
+                self.mark_dirty(str(context.guild.id), str(member.id))
                 audit_reason = mod.get_audit_reason(
                     context.author, reason=f"Member demoted to a Tier {tier} grinder."
                 )
-                roles = []
-                for tier_number in range(int(tier)):
-                    tn = str(tier_number + 1)
-                    if tiers[tn]:
-                        roles.append(tiers[tn]["role"])
+                roles = self.get_tier_roles(settings, int(tier) + 1, 5)
                 removed_roles = await self.add_or_remove_grinder_roles(
                     "remove", member, roles, audit_reason
                 )
@@ -864,7 +1175,7 @@ class GrinderLogger(commands.Cog):
                     tiers[tier]["amount"],
                     reason,
                 )
-                if await self.config.guild(context.guild).dm_status():
+                if settings["dm_status"]:
                     await self.dm_on_promote_or_demote(
                         member,
                         "demote",
@@ -895,7 +1206,8 @@ class GrinderLogger(commands.Cog):
 
         donations = await self.config.member(member).donations()
         times = await self.config.member(member).times_as_grinder()
-        tiers = await self.config.guild(context.guild).tiers()
+        settings = await self.get_guild_settings(context.guild)
+        tiers = settings["tiers"]
 
         guild_data = self.data.get(str(context.guild.id), {})
         if member_data := guild_data.get(str(member.id)):
@@ -993,14 +1305,12 @@ class GrinderLogger(commands.Cog):
         if not all_members:
             return await context.send(content="This guild has no grinders.")
 
+        member_config = await self.config.all_members(context.guild)
         all_m = {}
         for mid, md in all_members.copy().items():
             member = context.guild.get_member(int(mid))
-            donations = await self.config.member_from_ids(
-                context.guild.id, int(mid)
-            ).donations()
             all_m[member or mid] = {
-                "donations": donations,
+                "donations": member_config.get(int(mid), {}).get("donations", 0),
                 "due": md["due_timestamp"],
                 "tier": md["tier"],
             }
@@ -1016,6 +1326,84 @@ class GrinderLogger(commands.Cog):
         )
         await nu.NoobPaginator(pagified).start(context)
 
+    @grinderlogger.command(name="analytics")
+    @is_a_grinder_manager()
+    async def grinderlogger_analytics(
+        self, context: commands.Context, days: int = 7
+    ):
+        """
+        Show payment analytics of this guild's grinders.
+
+        Shows the on-time payment rate and average delay of the recent payments,
+        the total arrears of overdue grinders by tier, and the expected income for the next few days.
+        """
+        if days < 1 or days > 365:
+            return await context.send(content="Days must be between 1-365.")
+        grinders = self.data.get(str(context.guild.id), {})
+        if not grinders:
+            return await context.send(content="This guild has no grinders.")
+        settings = await self.get_guild_settings(context.guild)
+        tiers = settings["tiers"]
+        now = round(dt.datetime.now(dt.timezone.utc).timestamp())
+
+        on_time = late = 0
+        late_delay = 0
+        arrears: Dict[str, int] = {}
+        overdue: Dict[str, int] = {}
+        daily_income = 0
+        for member_data in grinders.values():
+            per_day = (tiers.get(member_data["tier"]) or {}).get("amount", 0)
+            daily_income += per_day
+            for _, delay, _ in member_data.get("payments", []):
+                if delay is None:
+                    continue
+                if delay <= 0:
+                    on_time += 1
+                else:
+                    late += 1
+                    late_delay += delay
+            due = member_data["due_timestamp"]
+            if due and due < now:
+                owed_days = -(-(now - due) // 86400)
+                tier = member_data["tier"]
+                arrears[tier] = arrears.get(tier, 0) + owed_days * per_day
+                overdue[tier] = overdue.get(tier, 0) + 1
+
+        rate = f"{on_time / (on_time + late):.0%}" if on_time + late else "N/A"
+        average = (
+            cf.humanize_timedelta(seconds=late_delay // late) if late else "None"
+        )
+        arrears_text = "\n".join(
+            f"`Tier {tier}`: {cf.humanize_number(arrears[tier])} ({overdue[tier]} overdue)"
+            for tier in sorted(arrears)
+        )
+        embed = discord.Embed(
+            title=f"Grinder Analytics for [{context.guild.name}]",
+            colour=await context.embed_colour(),
+            timestamp=dt.datetime.now(dt.timezone.utc),
+        )
+        embed.add_field(name="Grinders:", value=cf.humanize_number(len(grinders)))
+        embed.add_field(
+            name="On-time Payment Rate:",
+            value=f"{rate} ({on_time}/{on_time + late} payments)",
+        )
+        embed.add_field(name="Average Late Payment Delay:", value=average)
+        embed.add_field(
+            name="Arrears By Tier:",
+            value=arrears_text or "No grinder is overdue.",
+            inline=False,
+        )
+        embed.add_field(
+            name=f"Expected Income For The Next {days} Days:",
+            value=cf.humanize_number(daily_income * days),
+            inline=False,
+        )
+        embed.set_footer(
+            text=f"Based on the last {self.payment_history_size} payments of each grinder.",
+            icon_url=nu.is_have_avatar(context.guild),
+        )
+        await context.send(embed=embed)
+
     @grinderlogger.command(name="addmember")
     @commands.bot_has_permissions(manage_roles=True)
     async def grinderloggerset_addmember(
@@ -1036,7 +1424,8 @@ class GrinderLogger(commands.Cog):
                 content="Limit your damn reason to 2k characters."
             )
 
-        tiers = await self.config.guild(context.guild).tiers()
+        settings = await self.get_guild_settings(context.guild)
+        tiers = settings["tiers"]
 
         if not tiers[tier]:
             return await context.send(
@@ -1059,17 +1448,12 @@ class GrinderLogger(commands.Cog):
         times = await self.config.member(member).times_as_grinder()
         await self.config.member(member).times_as_grinder.set(times + 1)
         self.add_to_data(str(context.guild.id), str(member.id), member_data)
-
-        await self.back_to_config()
+        self.reschedule(str(context.guild.id), str(member.id))
 
         audit_reason = mod.get_audit_reason(
             context.author, reason=f"Member is a Tier {tier} grinder."
         )
-        roles = []
-        for tier_number in range(int(tier)):
-            tn = str(tier_number + 1)
-            if tiers[tn]:
-                roles.append(tiers[tn]["role"])
+        roles = self.get_tier_roles(settings, 1, int(tier))
         added_roles = await self.add_or_remove_grinder_roles(
             "add", member, roles, audit_reason
         )
@@ -1101,7 +1485,8 @@ class GrinderLogger(commands.Cog):
             return await context.send(
                 content="Limit your damn reason to 2k characters."
             )
-        tiers = await self.config.guild(context.guild).tiers()
+        settings = await self.get_guild_settings(context.guild)
+        tiers = settings["tiers"]
         if member_data := self.data.get(str(context.guild.id), {}).get(str(member.id)):
             tier = member_data["tier"]
             await self.log_grinder_history(
@@ -1115,7 +1500,6 @@ class GrinderLogger(commands.Cog):
                 reason,
             )
             self.remove_from_data(str(context.guild.id), str(member.id))
-            await self.back_to_config()
             await self.config.member_from_ids(
                 context.guild.id, member.id
             ).last_time_as_grinder.set(
@@ -1124,11 +1508,7 @@ class GrinderLogger(commands.Cog):
             audit_reason = mod.get_audit_reason(
                 context.author, reason=f"Member is no longer a Tier {tier} grinder."
             )
-            roles = []
-            for tier_number in range(int(tier)):
-                tn = str(tier_number + 1)
-                if tiers[tn]:
-                    roles.append(tiers[tn]["role"])
+            roles = self.get_tier_roles(settings, 1, int(tier))
             removed_roles = await self.add_or_remove_grinder_roles(
                 "remove", member, roles, audit_reason
             )
@@ -1139,6 +1519,263 @@ class GrinderLogger(commands.Cog):
         else:
             await context.send(content="This member is not a grinder.")
 
+    @grinderlogger.command(name="bulkadd")
+    @is_a_grinder_manager()
+    @commands.bot_has_permissions(manage_roles=True)
+    async def grinderlogger_bulkadd(
+        self,
+        context: commands.Context,
+        tier: Literal["1", "2", "3", "4", "5"],
+        members: commands.Greedy[discord.Member],
+        *,
+        reason: str = None,
+    ):
+        """
+        Add many members as grinders of the same tier at once.
+
+        Up to 100 members, members who are bots or already grinders are skipped.
+        Users will be DM-ed upon acceptance.
+
+        Example:
+        `[p]grlog bulkadd 1 @member1 @member2 member_id`
+        """
+        if not members:
+            return await context.send_help()
+        if reason and len(reason) > 2000:
+            return await context.send(
+                content="Limit your damn reason to 2k characters."
+            )
+        if len(members) > 100:
+            return await context.send(
+                content="You can only add up to 100 members at once."
+            )
+        settings = await self.get_guild_settings(context.guild)
+        tiers = settings["tiers"]
+        if not tiers[tier]:
+            return await context.send(
+                content="You haven't set any amount and role for this tier yet."
+            )
+
+        guild_id = str(context.guild.id)
+        grinders = self.data.get(guild_id, {})
+        to_add = list(
+            {
+                m.id: m for m in members if not m.bot and str(m.id) not in grinders
+            }.values()
+        )
+        skipped = [m for m in members if m not in to_add]
+        if not to_add:
+            return await context.send(
+                content="All of those members are either bots or already grinders."
+            )
+
+        now = round(dt.datetime.now(dt.timezone.utc).timestamp())
+        for member in to_add:
+            self.add_to_data(
+                guild_id,
+                str(member.id),
+                {
+                    "tier": tier,
+                    "due_timestamp": None,
+                    "grinder_since": now,
+                    "last_payed": None,
+                    "reminded": True,
+                },
+            )
+            self.reschedule(guild_id, str(member.id))
+        try:
+            await self.save_guild_data(guild_id)
+        except Exception as e:
+            for member in to_add:
+                self.remove_from_data(guild_id, str(member.id))
+            self.log.exception(str(e), exc_info=e)
+            return await context.send(
+                content="Something went wrong while saving the grinders, none of them were added."
+            )
+        try:
+            await self.increment_times_as_grinder(context.guild, to_add)
+        except Exception as e:
+            self.log.exception(str(e), exc_info=e)
+
+        roles = self.get_tier_roles(settings, 1, int(tier))
+        audit_reason = mod.get_audit_reason(
+            context.author, reason=f"Member is a Tier {tier} grinder."
+        )
+        semaphore = asyncio.Semaphore(5)
+
+        async def onboard(member: discord.Member):
+            async with semaphore:
+                try:
+                    added_roles = await self.add_or_remove_grinder_roles(
+                        "add", member, roles, audit_reason
+                    )
+                except discord.HTTPException:
+                    added_roles = []
+                await self.dm_grinder(
+                    context.guild,
+                    member,
+                    tiers[tier]["amount"],
+                    added_roles,
+                    tier,
+                    "added",
+                    reason,
+                )
+
+        await asyncio.gather(*(onboard(member) for member in to_add))
+        msg = f"Added **{len(to_add)}** members as Tier {tier} grinders."
+        if skipped:
+            msg += f"\nSkipped **{len(skipped)}** members who are bots or already grinders."
+        await context.send(content=msg)
+        await self.log_bulk_grinder_history(
+            context, "added", to_add, tier, tiers[tier]["amount"], reason=reason
+        )
+
+    @grinderlogger.command(name="bulkpromote")
+    @is_a_grinder_manager()
+    @commands.bot_has_permissions(manage_roles=True)
+    async def grinderlogger_bulkpromote(
+        self,
+        context: commands.Context,
+        tier: Literal["1", "2", "3", "4", "5"],
+        members: commands.Greedy[discord.Member],
+        *,
+        reason: str = None,
+    ):
+        """
+        Promote many grinders to the same higher tier at once.
+
+        Up to 100 members, members who are not grinders or are already that tier or higher are skipped.
+        Grinders will get a DM depending on the status of `[p]grlogset dmstatus`.
+        """
+        await self.bulk_change_tier(context, "promote", tier, members, reason)
+
+    @grinderlogger.command(name="bulkdemote")
+    @is_a_grinder_manager()
+    @commands.bot_has_permissions(manage_roles=True)
+    async def grinderlogger_bulkdemote(
+        self,
+        context: commands.Context,
+        tier: Literal["1", "2", "3", "4", "5"],
+        members: commands.Greedy[discord.Member],
+        *,
+        reason: str = None,
+    ):
+        """
+        Demote many grinders to the same lower tier at once.
+
+        Up to 100 members, members who are not grinders or are already that tier or lower are skipped.
+        Grinders will get a DM depending on the status of `[p]grlogset dmstatus`.
+        """
+        await self.bulk_change_tier(context, "demote", tier, members, reason)
+
+    async def bulk_change_tier(
+        self,
+        context: commands.Context,
+        _type: Literal["promote", "demote"],
+        tier: str,
+        members: List[discord.Member],
+        reason: str = None,
+    ):
+        if not members:
+            return await context.send_help()
+        if reason and len(reason) > 2000:
+            return await context.send(
+                content="Limit your damn reason to 2k characters."
+            )
+        if len(members) > 100:
+            return await context.send(
+                content=f"You can only {_type} up to 100 members at once."
+            )
+        settings = await self.get_guild_settings(context.guild)
+        tiers = settings["tiers"]
+        if not tiers[tier]:
+            return await context.send(
+                content="You haven't set any amount and role for this tier yet."
+            )
+
+        guild_id = str(context.guild.id)
+        grinders = self.data.get(guild_id, {})
+        before_tiers: Dict[int, str] = {}
+        for member in members:
+            member_data = grinders.get(str(member.id))
+            if not member_data or member.id in before_tiers:
+                continue
+            if (int(tier) > int(member_data["tier"])) == (_type == "promote") and (
+                tier != member_data["tier"]
+            ):
+                before_tiers[member.id] = member_data["tier"]
+        changed = [m for m in {m.id: m for m in members}.values() if m.id in before_tiers]
+        if not changed:
+            return await context.send(
+                content="None of those members are grinders that can be "
+                f"{'promoted' if _type == 'promote' else 'demoted'} to that tier."
+            )
+        for member in changed:
+            grinders[str(member.id)]["tier"] = tier
+            self.mark_dirty(guild_id, str(member.id))
+        try:
+            await self.save_guild_data(guild_id)
+        except Exception as e:
+            for member in changed:
+                if member_data := grinders.get(str(member.id)):
+                    member_data["tier"] = before_tiers[member.id]
+                    self.mark_dirty(guild_id, str(member.id))
+            self.log.exception(str(e), exc_info=e)
+            return await context.send(
+                content="Something went wrong while saving the grinders, none of them were "
+                f"{'promoted' if _type == 'promote' else 'demoted'}."
+            )
+
+        if _type == "promote":
+            roles = self.get_tier_roles(settings, 1, int(tier))
+            audit = f"Member promoted to a Tier {tier} grinder."
+        else:
+            roles = self.get_tier_roles(settings, int(tier) + 1, 5)
+            audit = f"Member demoted to a Tier {tier} grinder."
+        audit_reason = mod.get_audit_reason(context.author, reason=audit)
+        dm_status = settings["dm_status"]
+        semaphore = asyncio.Semaphore(5)
+
+        async def change(member: discord.Member):
+            async with semaphore:
+                try:
+                    changed_roles = await self.add_or_remove_grinder_roles(
+                        "add" if _type == "promote" else "remove",
+                        member,
+                        roles,
+                        audit_reason,
+                    )
+                except discord.HTTPException:
+                    changed_roles = []
+                if dm_status:
+                    await self.dm_on_promote_or_demote(
+                        member,
+                        _type,
+                        changed_roles,
+                        tiers[tier]["amount"],
+                        before_tiers[member.id],
+                        tier,
+                        reason,
+                    )
+
+        await asyncio.gather(*(change(member) for member in changed))
+        msg = (
+            f"{'Promoted' if _type == 'promote' else 'Demoted'} **{len(changed)}** "
+            f"grinders to Tier {tier}."
+        )
+        if skipped := len(members) - len(changed):
+            msg += f"\nSkipped **{skipped}** members."
+        await context.send(content=msg)
+        await self.log_bulk_grinder_history(
+            context,
+            _type,
+            changed,
+            tier,
+            tiers[tier]["amount"],
+            before_tiers,
+            reason,
+        )
+
     @commands.group(name="grinderloggerset", aliases=["grlogset"])
     @commands.admin_or_permissions(manage_guild=True)
     @commands.bot_has_permissions(embed_links=True)
@@ -1172,12 +1809,14 @@ class GrinderLogger(commands.Cog):
             except KeyError:
                 return await context.send(content="That bank does not seem to exist.")
             await self.config.guild(context.guild).bank.set(bank_name)
+            self.invalidate_settings(context.guild.id)
             await context.send(
                 content="Grinder donations will now get auto add/remove from donationlogger.\n"
                 f"Donations will be added from bank **{bank_name.title()}**."
             )
         else:
             await self.config.guild(context.guild).bank.set(None)
+            self.invalidate_settings(context.guild.id)
             await context.send(
                 content="The bank to auto add/remove from has been cleared."
             )
@@ -1189,6 +1828,7 @@ class GrinderLogger(commands.Cog):
         """
         current = await self.config.guild(context.guild).dm_status()
         await self.config.guild(context.guild).dm_status.set(not current)
+        self.invalidate_settings(context.guild.id)
         state = "will no longer" if current else "will now"
         await context.send(content=f"I {state} DM grinders their promotion/demotion.")
 
@@ -1238,6 +1878,7 @@ class GrinderLogger(commands.Cog):
                 else:
                     managers.remove(role.id)
                 success.append(role)
+        self.invalidate_settings(context.guild.id)
 
         _type = "was added to" if add_or_remove_or_list == "add" else "was removed from"
         _type2 = "add to" if add_or_remove_or_list == "add" else "remove from"
@@ -1274,6 +1915,7 @@ class GrinderLogger(commands.Cog):
 
         if _type == "logs":
             await _config.logging.set(channel.id if channel else None)
+            self.invalidate_settings(context.guild.id)
             await context.send(
                 content=(
                     f"Set {channel.mention} as the grinder logging channel."
@@ -1283,6 +1925,7 @@ class GrinderLogger(commands.Cog):
             )
         elif _type == "notify":
             await _config.notifying.set(channel.id if channel else None)
+            self.invalidate_settings(context.guild.id)
             await context.send(
                 content=(
                     f"Set {channel.mention} as the grinder notification channel."
@@ -1292,6 +1935,7 @@ class GrinderLogger(commands.Cog):
             )
         else:
             await _config.history.set(channel.id if channel else None)
+            self.invalidate_settings(context.guild.id)
             await context.send(
                 content=(
                     f"Set {channel.mention} as the grinder history channel."
@@ -1331,6 +1975,7 @@ class GrinderLogger(commands.Cog):
                         content="That tier already has an amount roles setup."
                     )
                 tiers[tier] = {"amount": amount, "role": role.id}
+            self.invalidate_settings(context.guild.id)
             await context.send(
                 content=f"Set Tier {tier} with the role {role.mention} and {cf.humanize_number(amount)}/day."
             )
@@ -1341,8 +1986,44 @@ class GrinderLogger(commands.Cog):
                         content="That tier does not have any amount roles setup."
                     )
                 tiers[tier] = {}
+            self.invalidate_settings(context.guild.id)
             await context.send(content="That tier has been cleared.")
 
+    @grinderloggerset.command(name="warnings")
+    async def grinderloggerset_warnings(self, context: commands.Context, *hours: int):
+        """
+        Set how many hours before their due date grinders get a due soon warning in their DMs.
+
+        Up to 5 warnings, each between 1 and 720 hours. Run the command without any hours to disable them.
+
+        Examples:
+        `[p]grlogset warnings 24 1`: Warn grinders 24 hours and 1 hour before their due date.
+        `[p]grlogset warnings`: Disable due soon warnings.
+        """
+        hours = sorted(set(hours), reverse=True)
+        if len(hours) > 5:
+            return await context.send(content="You can only set up to 5 warnings.")
+        if any(h < 1 or h > 720 for h in hours):
+            return await context.send(content="Hours must be between 1-720.")
+        await self.config.guild(context.guild).warnings.set(hours)
+        self.invalidate_settings(context.guild.id)
+        guild_id = str(context.guild.id)
+        if hours:
+            self.warning_hours[guild_id] = hours
+        else:
+            self.warning_hours.pop(guild_id, None)
+        for member_id in self.data.get(guild_id, {}):
+            self.reschedule(guild_id, member_id)
+        await context.send(
+            content=(
+                "Grinders will now be warned "
+                f"{cf.humanize_list([f'{h} hour' + ('s' if h > 1 else '') for h in hours])} "
+                "before their due date."
+                if hours
+                else "Due soon warnings have been disabled."
+            )
+        )
+
     @grinderloggerset.command(name="resetguild")
     async def grinderloggerset_resetguild(self, context: commands.Context):
         """
@@ -1354,13 +2035,17 @@ class GrinderLogger(commands.Cog):
         await view.start(context, act, content=conf)
         await view.wait()
         if view.value:
+            for member_id in self.data.get(str(context.guild.id), {}):
+                self.warning_wheel.cancel((str(context.guild.id), member_id))
+                self.unindex_grinder(str(context.guild.id), member_id)
             with contextlib.suppress(KeyError):
                 self.data.pop(str(context.guild.id))
-            old_data = (await self.config.custom("Grinders").all()).copy()
-            with contextlib.suppress(KeyError):
-                old_data.pop(str(context.guild.id))
-            await self.config.custom("Grinders").set(old_data)
+            self.scheduler.clear(str(context.guild.id))
+            self.warning_hours.pop(str(context.guild.id), None)
+            self.dirty = {k for k in self.dirty if k[0] != str(context.guild.id)}
+            await self.config.custom("Grinders", str(context.guild.id)).clear()
             await self.config.guild(context.guild).clear()
+            self.invalidate_settings(context.guild.id)
             await self.config.clear_all_members(context.guild)
 
     @grinderloggerset.command(name="resetcog")
@@ -1379,11 +2064,16 @@ class GrinderLogger(commands.Cog):
             self.save_data_to_config.restart()
             self.due_reminder_loop.restart()
             self.data.clear()
-            await self.back_to_config()
+            self.grinder_guilds.clear()
+            self.scheduler.clear()
+            self.warning_wheel = TimerWheel(time.time())
+            self.warning_hours.clear()
+            self.dirty.clear()
             await self.config.clear_all_guilds()
             await self.config.clear_all_custom("Grinders")
             await self.config.clear_all_members()
             await self.config.clear_all()
+            self.invalidate_settings()
             self.init_done = True
 
     @grinderloggerset.command(name="showsettings", aliases=["ss"])
@@ -1391,11 +2081,13 @@ class GrinderLogger(commands.Cog):
         """
         Show GrinderLogger settings.
         """
-        managers = await self.config.guild(context.guild).managers()
-        channels = await self.config.guild(context.guild).channels()
-        tiers = await self.config.guild(context.guild).tiers()
-        bank = await self.config.guild(context.guild).bank()
-        dm_status = await self.config.guild(context.guild).dm_status()
+        settings = await self.get_guild_settings(context.guild)
+        managers = settings["managers"]
+        channels = settings["channels"]
+        tiers = settings["tiers"]
+        bank = settings["bank"]
+        dm_status = settings["dm_status"]
+        warnings = settings["warnings"]
         logchan = f'<#{channels["logging"]}>' if channels["logging"] else "**None**"
         notifychan = (
             f'<#{channels["notifying"]}>' if channels["notifying"] else "**None**"
@@ -1423,6 +2115,15 @@ class GrinderLogger(commands.Cog):
             inline=False,
         )
         embed.add_field(name="DM Status:", value=dm_status, inline=False)
+        embed.add_field(
+            name="Due Soon Warnings:",
+            value=(
+                cf.humanize_list([f"{h}h" for h in warnings]) + " before due"
+                if warnings
+                else "**None**"
+            ),
+            inline=False,
+        )
         embed.add_field(name="Bank name to auto add/remove:", value=bank, inline=False)
         embed.add_field(
             name="Channels:",
@@ -0,0 +1,158 @@
+import asyncio
+import contextlib
+import heapq
+import time
+
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+
+class DueScheduler:
+    """
+    Min-heap of upcoming grinder due timestamps.
+
+    Heap entries are ``(due_timestamp, guild_id, member_id)`` tuples. Changing or
+    removing a due date only updates `entries`, stale heap entries are dropped
+    once they reach the top.
+    """
+
+    def __init__(self):
+        self.heap: List[Tuple[int, str, str]] = []
+        self.entries: Dict[Tuple[str, str], int] = {}
+        self.wakeup = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def schedule(self, guild_id: str, member_id: str, due_timestamp: int):
+        if self.entries.get((guild_id, member_id)) == due_timestamp:
+            return
+        self.entries[(guild_id, member_id)] = due_timestamp
+        entry = (due_timestamp, guild_id, member_id)
+        heapq.heappush(self.heap, entry)
+        if self.heap[0] == entry:
+            self.wakeup.set()
+        if len(self.heap) > 2 * len(self.entries) + 64:
+            self.heap = [(v, *k) for k, v in self.entries.items()]
+            heapq.heapify(self.heap)
+
+    def unschedule(self, guild_id: str, member_id: str):
+        self.entries.pop((guild_id, member_id), None)
+
+    def clear(self, guild_id: Optional[str] = None):
+        if guild_id is None:
+            self.entries.clear()
+            self.heap.clear()
+        else:
+            self.entries = {k: v for k, v in self.entries.items() if k[0] != guild_id}
+
+    def _peek(self) -> Optional[Tuple[int, str, str]]:
+        while self.heap:
+            due_timestamp, guild_id, member_id = self.heap[0]
+            if self.entries.get((guild_id, member_id)) == due_timestamp:
+                return self.heap[0]
+            heapq.heappop(self.heap)
+
+    def pop_due(self, now: float) -> List[Tuple[str, str]]:
+        """
+        Remove and return every ``(guild_id, member_id)`` that is due by now.
+        """
+        due = []
+        while (top := self._peek()) and top[0] <= now:
+            heapq.heappop(self.heap)
+            del self.entries[top[1:]]
+            due.append(top[1:])
+        return due
+
+    async def wait(self):
+        """
+        Sleep until the next due timestamp, or until an earlier one is scheduled.
+        """
+        self.wakeup.clear()
+        top = self._peek()
+        timeout = None if top is None else max(top[0] - time.time(), 0)
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self.wakeup.wait(), timeout)
+
+
+class TimerWheel:
+    """
+    Hierarchical timer wheel with minute precision.
+
+    Events are ``(owner, tag)`` pairs, an owner can have any number of tagged events.
+    The levels hold 60 minute slots, 24 hour slots and 64 day slots. Scheduling and
+    cancelling are O(1), and each `advance` tick only touches the slots that come due.
+    When a lower level wraps around, the next slot of the level above is cascaded
+    down. Events further away than the top level are placed again each time
+    their slot comes around.
+    """
+
+    levels = ((1, 60), (60, 24), (1440, 64))  # (minutes per slot, slot count)
+
+    def __init__(self, now: float):
+        self.current = int(now) // 60
+        self.slots: List[List[Dict[Tuple[Hashable, Hashable], int]]] = [
+            [{} for _ in range(count)] for _, count in self.levels
+        ]
+        self.locations: Dict[Tuple[Hashable, Hashable], Tuple[int, int]] = {}
+        self.owners: Dict[Hashable, Set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    def _place(self, event: Tuple[Hashable, Hashable], timestamp: int):
+        tick = timestamp // 60
+        delta = tick - self.current
+        for level, (minutes, count) in enumerate(self.levels):
+            if delta < minutes * count or level == len(self.levels) - 1:
+                break
+        slot = (tick // minutes) % count
+        self.slots[level][slot][event] = timestamp
+        self.locations[event] = (level, slot)
+
+    def schedule(self, owner: Hashable, tag: Hashable, timestamp: int):
+        """
+        Schedule an event, timestamps in the past fire on the next tick.
+        """
+        self.cancel(owner, tag)
+        self._place((owner, tag), max(int(timestamp), (self.current + 1) * 60))
+        self.owners.setdefault(owner, set()).add(tag)
+
+    def cancel(self, owner: Hashable, tag: Hashable = None):
+        """
+        Cancel one event of an owner, or all of them if no tag is given.
+        """
+        tags = self.owners.get(owner, set())
+        for t in [tag] if tag is not None else list(tags):
+            if location := self.locations.pop((owner, t), None):
+                del self.slots[location[0]][location[1]][(owner, t)]
+                tags.discard(t)
+        if not tags:
+            self.owners.pop(owner, None)
+
+    def _cascade(self, level: int, slot: int):
+        events, self.slots[level][slot] = self.slots[level][slot], {}
+        for event, timestamp in events.items():
+            self._place(event, timestamp)
+
+    def advance(self, now: float) -> List[Tuple[Hashable, Hashable]]:
+        """
+        Move the wheel up to now and return every ``(owner, tag)`` event that fired.
+        """
+        fired = []
+        target = int(now) // 60
+        while self.current < target:
+            self.current += 1
+            tick = self.current
+            for level in range(len(self.levels) - 1, 0, -1):
+                minutes, count = self.levels[level]
+                if tick % minutes == 0:
+                    self._cascade(level, (tick // minutes) % count)
+            events, self.slots[0][tick % 60] = self.slots[0][tick % 60], {}
+            for event in events:
+                del self.locations[event]
+                owner, tag = event
+                self.owners[owner].discard(tag)
+                if not self.owners[owner]:
+                    del self.owners[owner]
+                fired.append(event)
+        return fired